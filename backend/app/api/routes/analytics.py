@@ -4,37 +4,36 @@ Analytics endpoints for dashboard metrics.
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
-import math
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, extract
+from sqlalchemy import func, case, and_, extract, select, literal, union_all, cast, Float
 
+from app.core.cache import analytics_cache
 from app.core.database import get_db
-from app.models.bug import Bug as BugModel
+from app.models.bug import Bug as BugModel, bug_daily_stats, bug_overview_stats
 from app.schemas.bug import BugStats, BugTrends, TrendDataPoint
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def _percentile(sorted_data: list[float], percentile: int) -> Optional[float]:
-    """Calculate the given percentile from a sorted list using linear interpolation."""
-    if not sorted_data:
-        return None
-    n = len(sorted_data)
-    idx = (percentile / 100) * (n - 1)
-    lower = math.floor(idx)
-    upper = math.ceil(idx)
-    if lower == upper:
-        return round(sorted_data[lower], 1)
-    fraction = idx - lower
-    value = sorted_data[lower] + fraction * (sorted_data[upper] - sorted_data[lower])
-    return round(value, 1)
+def _breakdown_query(dimension: str, column, *filters):
+    """Build a per-value bug count for one dimension, tagged for use in a UNION ALL."""
+    return select(
+        literal(dimension).label("dimension"),
+        column.label("value"),
+        func.sum(bug_daily_stats.c.bug_count).label("count")
+    ).where(*filters).group_by(column)
+
+
+def _round_days(value) -> Optional[float]:
+    """Round a day count returned by Postgres to one decimal place."""
+    return round(float(value), 1) if value is not None else None
 
 
 @router.get("/analytics/overview", response_model=BugStats)
-def get_overview_stats(db: Session = Depends(get_db)):
+def get_overview_stats(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get overview statistics for the dashboard.
 
@@ -47,116 +46,89 @@ def get_overview_stats(db: Session = Depends(get_db)):
         - Recent activity count
     """
     try:
-        # Total bugs
-        total_bugs = db.query(func.count(BugModel.id)).scalar() or 0
-
-        # Open vs closed bugs
-        open_bugs = db.query(func.count(BugModel.id)).filter(
-            BugModel.status_category != "Done"
-        ).scalar()
-        closed_bugs = total_bugs - open_bugs
-
-        # Average resolution time (in days)
-        avg_resolution = db.query(
-            func.avg(
-                func.extract('epoch', BugModel.resolved_at - BugModel.created_at) / 86400
-            )
-        ).filter(
-            BugModel.resolved_at.isnot(None)
-        ).scalar()
-
-        # P50 and P90 resolution time percentiles (in days)
-        resolution_rows = db.query(
-            func.extract('epoch', BugModel.resolved_at - BugModel.created_at) / 86400
-        ).filter(
-            BugModel.resolved_at.isnot(None)
-        ).all()
-
-        resolution_days_sorted = sorted(float(row[0]) for row in resolution_rows if row[0] is not None)
-        p50_resolution = _percentile(resolution_days_sorted, 50)
-        p90_resolution = _percentile(resolution_days_sorted, 90)
-
-        # Bugs by priority
-        priority_counts = db.query(
-            BugModel.priority,
-            func.count(BugModel.id)
-        ).group_by(BugModel.priority).all()
-
-        bugs_by_priority = {
-            priority or "None": count
-            for priority, count in priority_counts
-        }
-
-        # Bugs by status
-        status_counts = db.query(
-            BugModel.status,
-            func.count(BugModel.id)
-        ).group_by(BugModel.status).all()
-
-        bugs_by_status = {
-            status: count
-            for status, count in status_counts
-        }
-
-        # Recent activity (last 7 days)
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        recent_activity = db.query(func.count(BugModel.id)).filter(
-            BugModel.updated_at >= seven_days_ago
-        ).scalar()
-
-        # AI Triage aggregations - Bugs by suggested team
-        team_counts = db.query(
-            BugModel.triage_team,
-            func.count(BugModel.id)
-        ).filter(
-            BugModel.triage_team.isnot(None)
-        ).group_by(BugModel.triage_team).all()
-
-        bugs_by_triage_team = {
-            team: count
-            for team, count in team_counts
-        }
-
-        # AI Triage aggregations - Bugs by category
-        category_counts = db.query(
-            BugModel.triage_category,
-            func.count(BugModel.id)
-        ).filter(
-            BugModel.triage_category.isnot(None)
-        ).group_by(BugModel.triage_category).all()
-
-        bugs_by_triage_category = {
-            category: count
-            for category, count in category_counts
-        }
-
-        # Triage coverage - percentage of bugs that have been triaged
-        triaged_count = db.query(func.count(BugModel.id)).filter(
-            BugModel.triaged_at.isnot(None)
-        ).scalar()
-        triage_coverage = round((triaged_count / total_bugs * 100), 1) if total_bugs > 0 else 0
-
-        return BugStats(
-            total_bugs=total_bugs,
-            open_bugs=open_bugs,
-            closed_bugs=closed_bugs,
-            avg_resolution_time_days=round(float(avg_resolution), 1) if avg_resolution else None,
-            p50_resolution_time_days=p50_resolution,
-            p90_resolution_time_days=p90_resolution,
-            bugs_by_priority=bugs_by_priority,
-            bugs_by_status=bugs_by_status,
-            recent_activity_count=recent_activity,
-            bugs_by_triage_team=bugs_by_triage_team,
-            bugs_by_triage_category=bugs_by_triage_category,
-            triage_coverage=triage_coverage
+        return analytics_cache.get_or_set(
+            ("overview",), lambda: _get_overview_stats(db), response, request
         )
     except Exception as e:
         logger.error(f"Error fetching overview stats: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch overview stats: {str(e)}")
 
 
+def _get_overview_stats(db: Session) -> BugStats:
+    # Bug counts from the daily stats materialized view
+    stats = bug_daily_stats.c
+    totals = db.query(
+        func.coalesce(func.sum(stats.bug_count), 0).label("total"),
+        func.coalesce(
+            func.sum(stats.bug_count).filter(stats.status_category != "Done"), 0
+        ).label("open"),
+        func.coalesce(
+            func.sum(stats.bug_count).filter(stats.triaged), 0
+        ).label("triaged")
+    ).select_from(bug_daily_stats).one()
+
+    # Resolution time stats (in days) and recent activity, precomputed at the last write
+    activity = db.query(
+        bug_overview_stats.c.avg_resolution_days.label("avg_resolution"),
+        bug_overview_stats.c.p50_resolution_days.label("p50_resolution"),
+        bug_overview_stats.c.p90_resolution_days.label("p90_resolution"),
+        bug_overview_stats.c.recent_count.label("recent")
+    ).one()
+
+    total_bugs = totals.total
+    open_bugs = totals.open
+    closed_bugs = total_bugs - open_bugs
+    avg_resolution = activity.avg_resolution
+    recent_activity = activity.recent or 0
+    triaged_count = totals.triaged
+
+    # Priority, status and AI triage breakdowns in one round-trip
+    breakdowns = db.execute(union_all(
+        _breakdown_query("priority", stats.priority),
+        _breakdown_query("status", stats.status),
+        _breakdown_query("triage_team", stats.triage_team, stats.triage_team.isnot(None)),
+        _breakdown_query(
+            "triage_category", stats.triage_category, stats.triage_category.isnot(None)
+        )
+    )).all()
+
+    bugs_by_priority = {}
+    bugs_by_status = {}
+    bugs_by_triage_team = {}
+    bugs_by_triage_category = {}
+    for dimension, value, count in breakdowns:
+        if dimension == "priority":
+            bugs_by_priority[value or "None"] = count
+        elif dimension == "status":
+            bugs_by_status[value] = count
+        elif dimension == "triage_team":
+            bugs_by_triage_team[value] = count
+        else:
+            bugs_by_triage_category[value] = count
+
+    # Triage coverage - percentage of bugs that have been triaged
+    triage_coverage = round((triaged_count / total_bugs * 100), 1) if total_bugs > 0 else 0
+
+    return BugStats(
+        total_bugs=total_bugs,
+        open_bugs=open_bugs,
+        closed_bugs=closed_bugs,
+        avg_resolution_time_days=round(float(avg_resolution), 1) if avg_resolution else None,
+        p50_resolution_time_days=_round_days(activity.p50_resolution),
+        p90_resolution_time_days=_round_days(activity.p90_resolution),
+        bugs_by_priority=bugs_by_priority,
+        bugs_by_status=bugs_by_status,
+        recent_activity_count=recent_activity,
+        bugs_by_triage_team=bugs_by_triage_team,
+        bugs_by_triage_category=bugs_by_triage_category,
+        triage_coverage=triage_coverage
+    )
+
+
 @router.get("/analytics/trends", response_model=BugTrends)
 def get_bug_trends(
+    request: Request,
+    response: Response,
     days: int = Query(30, ge=7, le=365, description="Number of days to analyze"),
     db: Session = Depends(get_db)
 ):
@@ -172,7 +144,9 @@ def get_bug_trends(
         - Status distribution over time
     """
     try:
-        return _get_bug_trends(db, days)
+        return analytics_cache.get_or_set(
+            ("trends", days), lambda: _get_bug_trends(db, days), response, request
+        )
     except Exception as e:
         logger.error(f"Error fetching bug trends: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch bug trends: {str(e)}")
@@ -183,14 +157,14 @@ def _get_bug_trends(db: Session, days: int) -> BugTrends:
 
     # Daily created bugs
     created_trends = db.query(
-        func.date(BugModel.created_at).label('date'),
-        func.count(BugModel.id).label('count')
+        bug_daily_stats.c.day,
+        func.sum(bug_daily_stats.c.bug_count)
     ).filter(
-        BugModel.created_at >= start_date
+        bug_daily_stats.c.day >= start_date.date()
     ).group_by(
-        func.date(BugModel.created_at)
+        bug_daily_stats.c.day
     ).order_by(
-        func.date(BugModel.created_at)
+        bug_daily_stats.c.day
     ).all()
     
     daily_created = [
@@ -198,17 +172,18 @@ def _get_bug_trends(db: Session, days: int) -> BugTrends:
         for date, count in created_trends
     ]
     
-    # Daily resolved bugs
+    # Daily resolved bugs, grouped on the idx_bugs_resolved_day expression
+    resolved_day = func.date(func.timezone('UTC', BugModel.resolved_at)).label('date')
     resolved_trends = db.query(
-        func.date(BugModel.resolved_at).label('date'),
-        func.count(BugModel.id).label('count')
+        resolved_day,
+        func.count().label('count')
     ).filter(
-        BugModel.resolved_at >= start_date,
-        BugModel.resolved_at.isnot(None)
+        BugModel.resolved_at.isnot(None),
+        func.date(func.timezone('UTC', BugModel.resolved_at)) >= start_date.date()
     ).group_by(
-        func.date(BugModel.resolved_at)
+        resolved_day
     ).order_by(
-        func.date(BugModel.resolved_at)
+        resolved_day
     ).all()
     
     daily_resolved = [
@@ -216,18 +191,21 @@ def _get_bug_trends(db: Session, days: int) -> BugTrends:
         for date, count in resolved_trends
     ]
     
-    # Status over time (weekly snapshots)
+    # Status over time (weekly snapshots), grouped on the idx_bugs_updated_week_status
+    # expression; the first bucket covers the whole week containing start_date
+    updated_week = func.date_trunc('week', func.timezone('UTC', BugModel.updated_at)).label('week')
     status_trends = db.query(
-        func.date_trunc('week', BugModel.updated_at).label('week'),
+        updated_week,
         BugModel.status,
-        func.count(BugModel.id).label('count')
+        func.count().label('count')
     ).filter(
-        BugModel.updated_at >= start_date
+        func.date_trunc('week', func.timezone('UTC', BugModel.updated_at))
+        >= func.date_trunc('week', start_date)
     ).group_by(
-        func.date_trunc('week', BugModel.updated_at),
+        updated_week,
         BugModel.status
     ).order_by(
-        func.date_trunc('week', BugModel.updated_at)
+        updated_week
     ).all()
     
     status_over_time = [
@@ -243,61 +221,78 @@ def _get_bug_trends(db: Session, days: int) -> BugTrends:
 
 
 @router.get("/analytics/resolution-times")
-def get_resolution_times(db: Session = Depends(get_db)):
+def get_resolution_times(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Analyze bug resolution times.
     
     Returns:
         - Distribution of resolution times
-        - Average by priority
-        - Fastest/slowest resolutions
+        - Slowest 100 resolutions
+        - Average and p50/p90 by priority
     """
     try:
-        return _get_resolution_times(db)
+        return analytics_cache.get_or_set(
+            ("resolution_times",), lambda: _get_resolution_times(db), response, request
+        )
     except Exception as e:
         logger.error(f"Error fetching resolution times: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to fetch resolution times: {str(e)}")
 
 
 def _get_resolution_times(db: Session):
-    # Resolution time distribution
+    resolution_days = cast(
+        extract('epoch', BugModel.resolved_at - BugModel.created_at) / 86400, Float
+    )
+    resolved = BugModel.resolved_at.isnot(None)
+
+    # Slowest resolutions, sorted and limited in SQL
     resolution_data = db.query(
         BugModel.jira_key,
         BugModel.priority,
-        func.extract('epoch', BugModel.resolved_at - BugModel.created_at).label('seconds')
+        resolution_days.label('days')
     ).filter(
-        BugModel.resolved_at.isnot(None)
-    ).all()
-    
-    # Convert to days
+        resolved
+    ).order_by(
+        resolution_days.desc()
+    ).limit(100).all()
+
     resolution_times = [
         {
             "jira_key": key,
             "priority": priority,
-            "days": round(float(seconds) / 86400, 1) if seconds else 0
+            "days": _round_days(days) or 0
         }
-        for key, priority, seconds in resolution_data
+        for key, priority, days in resolution_data
     ]
-    
-    # Average by priority
-    avg_by_priority = db.query(
+
+    # Count, average and percentiles by priority in a single pass
+    by_priority = db.query(
         BugModel.priority,
-        func.avg(
-            func.extract('epoch', BugModel.resolved_at - BugModel.created_at) / 86400
-        ).label('avg_days')
+        func.count().label('resolved_count'),
+        func.avg(resolution_days).label('avg_days'),
+        func.percentile_cont(0.5).within_group(resolution_days).label('p50_days'),
+        func.percentile_cont(0.9).within_group(resolution_days).label('p90_days')
     ).filter(
-        BugModel.resolved_at.isnot(None)
+        resolved
     ).group_by(
         BugModel.priority
     ).all()
-    
+
     priority_averages = {
-        priority or "None": round(float(avg_days), 1)
-        for priority, avg_days in avg_by_priority if avg_days
+        row.priority or "None": _round_days(row.avg_days)
+        for row in by_priority if row.avg_days
     }
-    
+    priority_percentiles = {
+        row.priority or "None": {
+            "p50": _round_days(row.p50_days),
+            "p90": _round_days(row.p90_days)
+        }
+        for row in by_priority
+    }
+
     return {
-        "resolution_times": resolution_times[:100],  # Limit to 100 for performance
+        "resolution_times": resolution_times,
         "average_by_priority": priority_averages,
-        "total_resolved": len(resolution_times)
+        "percentiles_by_priority": priority_percentiles,
+        "total_resolved": sum(row.resolved_count for row in by_priority)
     }
@@ -1,26 +1,272 @@
 """
 Bug CRUD endpoints.
 """
+import io
+import logging
 from datetime import datetime, timezone
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-
-from app.core.database import get_db
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import func, desc, lambda_stmt, literal, literal_column, select, text, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert
+import orjson
+
+from app.core.cache import analytics_cache
+from app.core.database import SessionLocal, get_db
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.config import settings
-from app.models.bug import Bug as BugModel, SyncLog
+from app.models.bug import Bug as BugModel, SyncLog, bug_daily_stats
 from app.schemas.bug import Bug, BugList, BugCreate
 from app.services.jira_client import jira_client
-from app.services.triage_service import triage_service
+from app.services.triage_service import triage_service, TriageResult
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Triage columns reset when a bug changes upstream and needs re-triage
+_CLEARED_TRIAGE = {
+    "triage_category": None,
+    "triage_priority": None,
+    "triage_urgency": None,
+    "triage_team": None,
+    "triage_tags": None,
+    "triage_confidence": None,
+    "triage_reasoning": None,
+    "triaged_at": None,
+}
+
+
+def _refresh_analytics(db: Session) -> None:
+    """
+    Refresh the analytics aggregates and drop cached responses after bugs were written.
+
+    Failures are logged rather than raised: the bug changes are already
+    committed, and the views are refreshed again after the next write.
+    """
+    for view in ("bug_daily_stats", "bug_overview_stats"):
+        try:
+            db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Failed to refresh {view}: {e}")
+    analytics_cache.clear()
+
+
+def _refresh_analytics_in_background() -> None:
+    """Run _refresh_analytics after a response, on its own database session."""
+    db = SessionLocal()
+    try:
+        _refresh_analytics(db)
+    finally:
+        db.close()
+
+
+def _apply_triage(bug: BugModel, result: TriageResult) -> None:
+    """Store a triage result on a bug."""
+    bug.triage_category = result.category
+    bug.triage_priority = result.priority_recommendation
+    bug.triage_urgency = result.urgency
+    bug.triage_team = result.suggested_team
+    bug.triage_tags = result.tags
+    bug.triage_confidence = result.confidence
+    bug.triage_reasoning = result.reasoning
+    bug.triaged_at = datetime.now(timezone.utc)
+
+
+def _triage_bugs(bugs: list[BugModel]) -> tuple[int, int]:
+    """
+    Triage bugs concurrently with Claude and store the results.
+
+    The API calls are overlapped on an event loop by the triage service;
+    results are applied to the bugs afterwards on the calling thread.
+
+    Returns:
+        Tuple of (triaged count, error count)
+    """
+    results = triage_service.triage_bugs_batch([
+        {
+            "jira_key": bug.jira_key,
+            "summary": bug.summary,
+            "description": bug.description,
+            "priority": bug.priority,
+            "component": bug.component,
+            "labels": bug.labels
+        }
+        for bug in bugs
+    ])
+
+    triaged_count = 0
+    for bug in bugs:
+        result = results.get(bug.jira_key)
+        if result:
+            _apply_triage(bug, result)
+            triaged_count += 1
+
+    return triaged_count, len(bugs) - triaged_count
+
+
+def _triage_in_batches(db: Session, query, limit: int = 0, batch_size: int = 100) -> tuple[int, int]:
+    """
+    Triage the bugs matched by a query, loading and committing them in batches.
+
+    Bugs are paged by id so only one batch of rows is held in memory at a
+    time, and bugs whose triage failed are not picked up again.
+
+    Args:
+        db: Database session
+        query: Query over BugModel selecting the bugs to triage
+        limit: Maximum number of bugs to triage (0 = unlimited)
+        batch_size: Bugs loaded and committed per batch
+
+    Returns:
+        Tuple of (triaged count, error count)
+    """
+    triaged_count = 0
+    error_count = 0
+    attempted = 0
+    last_id = 0
+
+    while not limit or attempted < limit:
+        size = min(batch_size, limit - attempted) if limit else batch_size
+        batch = query.filter(BugModel.id > last_id).order_by(BugModel.id).limit(size).all()
+        if not batch:
+            break
+
+        batch_triaged, batch_errors = _triage_bugs(batch)
+        triaged_count += batch_triaged
+        error_count += batch_errors
+        attempted += len(batch)
+        last_id = batch[-1].id
+        db.commit()
+
+    if limit and attempted >= limit:
+        skipped = query.filter(BugModel.id > last_id).count()
+        if skipped:
+            logger.info(f"Triage limit of {limit} reached, {skipped} bugs left untriaged")
+
+    return triaged_count, error_count
+
+
+# Batches at least this large are loaded with COPY instead of a multi-row INSERT
+COPY_THRESHOLD = 100
+
+
+def _upsert_bugs(db: Session, bug_rows: list[dict], batch_size: int = 500) -> int:
+    """
+    Insert or update parsed Jira bugs by jira_key, committing each batch.
+
+    Small batches use a multi-row INSERT ... ON CONFLICT DO UPDATE statement;
+    batches of COPY_THRESHOLD rows or more are streamed in with COPY first
+    (see _copy_upsert_batch). Batching keeps Postgres under its bind parameter
+    limit, and committing per batch keeps row locks short-lived during large
+    syncs. Only the columns present in the rows are overwritten, so triage
+    results are preserved unless the rows set them explicitly. All rows in a
+    call must have the same keys.
+
+    Returns:
+        Number of rows that were inserted rather than updated
+    """
+    inserted_count = 0
+    for start in range(0, len(bug_rows), batch_size):
+        batch = bug_rows[start:start + batch_size]
+        if len(batch) >= COPY_THRESHOLD:
+            inserted_count += _copy_upsert_batch(db, batch)
+        else:
+            stmt = insert(BugModel).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[BugModel.jira_key],
+                set_={key: stmt.excluded[key] for key in batch[0] if key != "jira_key"}
+            ).returning(
+                # xmax is 0 only for freshly inserted row versions
+                literal_column("xmax = 0")
+            )
+            inserted_count += sum(1 for (inserted,) in db.execute(stmt) if inserted)
+        db.commit()
+    return inserted_count
+
+
+def _copy_upsert_batch(db: Session, batch: list[dict]) -> int:
+    """
+    Upsert one batch of bugs through a temporary staging table loaded with COPY.
+
+    COPY streams the rows as a single CSV payload instead of binding every
+    value as a statement parameter; a set-based INSERT ... SELECT then applies
+    the same ON CONFLICT DO UPDATE as the multi-row INSERT path. The staging
+    table is dropped when the batch commits.
+
+    Returns:
+        Number of rows that were inserted rather than updated
+    """
+    columns = list(batch[0])
+    column_list = ", ".join(columns)
+
+    db.execute(text(
+        f"CREATE TEMP TABLE bugs_staging ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM bugs WITH NO DATA"
+    ))
+
+    buffer = io.StringIO()
+    for row in batch:
+        buffer.write(",".join(_copy_csv_field(row[key]) for key in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY bugs_staging ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+    staged_rows = select(*(literal_column(key) for key in columns)).select_from(text("bugs_staging"))
+    stmt = insert(BugModel).from_select(columns, staged_rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[BugModel.jira_key],
+        set_={key: stmt.excluded[key] for key in columns if key != "jira_key"}
+    ).returning(
+        literal_column("xmax = 0")
+    )
+    return sum(1 for (inserted,) in db.execute(stmt) if inserted)
+
+
+def _copy_csv_field(value) -> str:
+    """Format one value as a COPY CSV field; an unquoted empty field is NULL."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, (list, dict)):
+        value = orjson.dumps(value).decode()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _get_bug_by_key(db: Session, jira_key: str) -> Optional[BugModel]:
+    """
+    Load one bug by Jira key.
+
+    Built as a lambda statement so SQLAlchemy caches it by code location and
+    skips rebuilding and compiling the SELECT; jira_key is bound per call.
+    """
+    stmt = lambda_stmt(lambda: select(BugModel).where(BugModel.jira_key == jira_key))
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def _updated_at_by_key(db: Session, jira_keys: list[str]) -> dict:
+    """Map the given Jira keys to the stored updated_at of existing bugs, in a single IN query."""
+    if not jira_keys:
+        return {}
+    return dict(
+        db.query(BugModel.jira_key, BugModel.updated_at).filter(BugModel.jira_key.in_(jira_keys)).all()
+    )
+
+
 @router.get("/bugs", response_model=BugList)
 def list_bugs(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces page)"),
     status: Optional[str] = Query(None, description="Filter by status"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     search: Optional[str] = Query(None, description="Search in summary"),
@@ -28,10 +274,14 @@ def list_bugs(
 ):
     """
     List bugs with pagination and filtering.
+
+    Pages can be addressed by number, or by cursor for constant-cost deep
+    paging. Cursor pages skip the total count, so total/total_pages are null.
     
     Args:
         page: Page number (starts at 1)
         page_size: Number of bugs per page
+        cursor: Opaque keyset cursor (optional)
         status: Filter by status (optional)
         priority: Filter by priority (optional)
         search: Search term for summary (optional)
@@ -40,33 +290,65 @@ def list_bugs(
     Returns:
         Paginated list of bugs
     """
-    # Build query
-    query = db.query(BugModel)
-    
-    # Apply filters
+    # Build filters
+    filters = []
     if status:
-        query = query.filter(BugModel.status == status)
+        filters.append(BugModel.status == status)
     if priority:
-        query = query.filter(BugModel.priority == priority)
+        filters.append(BugModel.priority == priority)
     if search:
-        query = query.filter(BugModel.summary.ilike(f"%{search}%"))
-    
-    # Get total count
-    total = query.count()
-    
-    # Apply pagination and ordering
-    bugs = query.order_by(desc(BugModel.updated_at)).offset((page - 1) * page_size).limit(page_size).all()
-    
-    # Calculate total pages
-    total_pages = (total + page_size - 1) // page_size
-    
-    return BugList(
+        filters.append(BugModel.summary.ilike(f"%{search}%"))
+
+    # Skip the wide description/raw_data columns the list view doesn't render
+    query = db.query(BugModel).options(
+        defer(BugModel.description),
+        defer(BugModel.raw_data)
+    ).filter(
+        *filters
+    ).order_by(
+        desc(BugModel.updated_at), desc(BugModel.id)
+    )
+
+    if cursor:
+        # Seek past the last row of the previous page on idx_bugs_updated_id
+        cursor_updated_at, cursor_id = decode_cursor(cursor)
+        bugs = query.filter(
+            tuple_(BugModel.updated_at, BugModel.id) < (cursor_updated_at, cursor_id)
+        ).limit(page_size).all()
+        page = total = total_pages = None
+    else:
+        # Fetch the page and the total match count in one query
+        rows = query.add_columns(
+            func.count(BugModel.id).over().label("total")
+        ).offset((page - 1) * page_size).limit(page_size).all()
+
+        bugs = [bug for bug, _ in rows]
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there is no row to carry the window count
+            total = db.query(func.count(BugModel.id)).filter(*filters).scalar()
+        else:
+            total = 0
+
+        # Calculate total pages
+        total_pages = (total + page_size - 1) // page_size
+
+    next_cursor = None
+    if len(bugs) == page_size:
+        next_cursor = encode_cursor(bugs[-1].updated_at, bugs[-1].id)
+
+    # Validate the ORM rows once and encode directly; returning a response
+    # skips FastAPI's second validation pass against response_model, which
+    # is kept for the OpenAPI schema
+    return ORJSONResponse(BugList(
         bugs=bugs,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
-    )
+        total_pages=total_pages,
+        next_cursor=next_cursor
+    ).model_dump())
 
 
 @router.get("/bugs/{jira_key}", response_model=Bug)
@@ -81,7 +363,7 @@ def get_bug(jira_key: str, db: Session = Depends(get_db)):
     Returns:
         Bug details
     """
-    bug = db.query(BugModel).filter(BugModel.jira_key == jira_key).first()
+    bug = _get_bug_by_key(db, jira_key)
     
     if not bug:
         raise HTTPException(status_code=404, detail=f"Bug {jira_key} not found")
@@ -89,22 +371,25 @@ def get_bug(jira_key: str, db: Session = Depends(get_db)):
     return bug
 
 
-@router.post("/bugs/sync")
+@router.post("/bugs/sync", status_code=202)
 def sync_bugs(
+    background_tasks: BackgroundTasks,
     fetch_all: bool = Query(True, description="Fetch all bugs including closed ones"),
     auto_triage: bool = Query(True, description="Auto-triage new bugs with Claude AI"),
     triage_limit: int = Query(20, ge=0, le=100, description="Max bugs to triage per sync (0 = unlimited)"),
     db: Session = Depends(get_db)
 ):
     """
-    Sync bugs from Jira API to database.
+    Queue a sync of bugs from Jira API to database.
 
-    This endpoint:
+    The sync runs in the background after the response is sent:
     1. Fetches bugs from Jira API
     2. Parses and transforms the data
     3. Updates existing bugs or creates new ones
     4. Optionally auto-triages new bugs with Claude AI
 
+    Poll GET /bugs/sync/{job_id} for progress and results.
+
     Args:
         fetch_all: If True, fetch all bugs. If False, only fetch open bugs.
         auto_triage: If True, automatically triage new/untriaged bugs.
@@ -112,112 +397,157 @@ def sync_bugs(
         db: Database session
 
     Returns:
-        Summary of sync operation
+        Job id of the queued sync
     """
-    try:
-        # Fetch bugs from Jira
-        status_filter = None if fetch_all else "!=Done"
-        raw_bugs = jira_client.get_all_bugs(status_filter=status_filter)
+    sync_log = SyncLog(sync_type="full", status="queued")
+    db.add(sync_log)
+    db.commit()
 
-        # Parse and upsert bugs
-        created_count = 0
-        updated_count = 0
-        bugs_to_triage = []
+    background_tasks.add_task(_run_sync, sync_log.id, fetch_all, auto_triage, triage_limit)
 
-        for raw_bug in raw_bugs:
-            bug_data = jira_client.parse_bug(raw_bug)
+    return {
+        "job_id": sync_log.id,
+        "status": sync_log.status,
+        "message": f"Sync queued, poll /api/bugs/sync/{sync_log.id} for progress"
+    }
 
-            # Check if bug exists
-            existing_bug = db.query(BugModel).filter(
-                BugModel.jira_key == bug_data["jira_key"]
-            ).first()
 
-            if existing_bug:
-                # Update existing bug
-                for key, value in bug_data.items():
-                    setattr(existing_bug, key, value)
-                updated_count += 1
-                # Add to triage queue if not yet triaged
-                if auto_triage and existing_bug.triaged_at is None:
-                    bugs_to_triage.append(existing_bug)
-            else:
-                # Create new bug
-                new_bug = BugModel(**bug_data)
-                db.add(new_bug)
-                db.flush()  # Get the ID assigned
-                created_count += 1
-                # Add new bugs to triage queue
-                if auto_triage:
-                    bugs_to_triage.append(new_bug)
+def _run_sync(job_id: int, fetch_all: bool, auto_triage: bool, triage_limit: int) -> None:
+    """
+    Run a full Jira sync for a queued job, recording progress on its SyncLog.
 
-        # Auto-triage bugs if enabled and service is available
-        triaged_count = 0
-        triage_errors = 0
-        triage_skipped = 0
-
-        if auto_triage and settings.TRIAGE_ENABLED and triage_service.is_available():
-            for bug in bugs_to_triage:
-                # Stop if we've reached the triage limit (0 = unlimited)
-                if triage_limit > 0 and triaged_count >= triage_limit:
-                    triage_skipped = len(bugs_to_triage) - triaged_count - triage_errors
-                    break
-                try:
-                    result = triage_service.triage_bug(
-                        summary=bug.summary,
-                        description=bug.description,
-                        current_priority=bug.priority,
-                        component=bug.component,
-                        labels=bug.labels
-                    )
-                    if result:
-                        bug.triage_category = result.category
-                        bug.triage_priority = result.priority_recommendation
-                        bug.triage_urgency = result.urgency
-                        bug.triage_team = result.suggested_team
-                        bug.triage_tags = result.tags
-                        bug.triage_confidence = result.confidence
-                        bug.triage_reasoning = result.reasoning
-                        bug.triaged_at = datetime.now(timezone.utc)
-                        triaged_count += 1
-                except Exception:
-                    triage_errors += 1
-
-        # Commit changes
+    Runs outside the request, so it opens its own database session.
+    """
+    db = SessionLocal()
+    try:
+        sync_log = db.get(SyncLog, job_id)
+        sync_log.status = "running"
         db.commit()
 
-        return {
-            "status": "success",
-            "total_fetched": len(raw_bugs),
-            "created": created_count,
-            "updated": updated_count,
-            "triaged": triaged_count,
-            "triage_errors": triage_errors,
-            "triage_skipped": triage_skipped,
-            "message": f"Synced {len(raw_bugs)} bugs from Jira, triaged {triaged_count} bugs" + (f" ({triage_skipped} skipped due to limit)" if triage_skipped > 0 else "")
-        }
-
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Sync failed: {str(e)}")
+        try:
+            # Fetch bugs from Jira page by page, upserting and committing each page
+            # so only one page of raw and parsed bugs is held in memory
+            status_filter = None if fetch_all else "!=Done"
+            jira_keys = set()
+            # Stamped on every synced row, so auto-triage can find them without a key list
+            sync_started = datetime.now(timezone.utc)
+            sync_log.bugs_fetched = 0
+            sync_log.bugs_created = 0
+            sync_log.bugs_updated = 0
+
+            for raw_bugs in jira_client.iter_bug_pages(status_filter=status_filter):
+                sync_log.bugs_fetched += len(raw_bugs)
+
+                # Parse bugs, skipping issues already synced from an earlier page
+                page_bugs = {}
+                for raw_bug in raw_bugs:
+                    bug_data = jira_client.parse_bug(raw_bug)
+                    if bug_data["jira_key"] not in jira_keys:
+                        page_bugs[bug_data["jira_key"]] = {**bug_data, "fetched_at": sync_started}
+                jira_keys.update(page_bugs)
+
+                # Upsert bugs, counting inserts from the statement itself
+                created_count = _upsert_bugs(db, list(page_bugs.values()))
+                sync_log.bugs_created += created_count
+                sync_log.bugs_updated += len(page_bugs) - created_count
+                db.commit()  # Publish progress for GET /bugs/sync/{job_id}
+
+            # Auto-triage new and untriaged bugs if enabled and service is available
+            if auto_triage and settings.TRIAGE_ENABLED and triage_service.is_available():
+                # Walks idx_bugs_untriaged_id instead of binding every synced key
+                untriaged = db.query(BugModel).filter(
+                    BugModel.triaged_at.is_(None),
+                    BugModel.fetched_at >= sync_started
+                )
+                sync_log.bugs_triaged, sync_log.triage_errors = _triage_in_batches(
+                    db, untriaged, limit=triage_limit
+                )
+
+            sync_log.status = "success"
+            sync_log.completed_at = datetime.now(timezone.utc)
+            db.commit()
+            _refresh_analytics(db)
+
+        except Exception as e:
+            logger.error(f"Sync {job_id} failed: {e}", exc_info=True)
+            db.rollback()
+            sync_log.status = "failed"
+            sync_log.error_message = str(e)
+            sync_log.completed_at = datetime.now(timezone.utc)
+            db.commit()
+    finally:
+        db.close()
 
 
 @router.get("/bugs/statuses/list")
-def list_statuses(db: Session = Depends(get_db)):
+def list_statuses(request: Request, response: Response, db: Session = Depends(get_db)):
     """Get list of all unique statuses."""
-    statuses = db.query(BugModel.status).distinct().all()
-    return {"statuses": [s[0] for s in statuses if s[0]]}
+    return analytics_cache.get_or_set(
+        ("statuses",),
+        lambda: {"statuses": _distinct_values(db, bug_daily_stats.c.status)},
+        response,
+        request
+    )
 
 
 @router.get("/bugs/priorities/list")
-def list_priorities(db: Session = Depends(get_db)):
+def list_priorities(request: Request, response: Response, db: Session = Depends(get_db)):
     """Get list of all unique priorities."""
-    priorities = db.query(BugModel.priority).distinct().all()
-    return {"priorities": [p[0] for p in priorities if p[0]]}
+    return analytics_cache.get_or_set(
+        ("priorities",),
+        lambda: {"priorities": _distinct_values(db, bug_daily_stats.c.priority)},
+        response,
+        request
+    )
+
+
+def _distinct_values(db: Session, column) -> list:
+    """Read the distinct non-empty values of a column from the daily stats view."""
+    return db.execute(
+        select(column).where(column.isnot(None), column != "").distinct()
+    ).scalars().all()
+
+
+@router.get("/bugs/facets/list")
+def list_facets(request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Get the unique values of every filterable dimension in one call.
+
+    Returns:
+        Statuses, priorities, triage categories and triage teams
+    """
+    return analytics_cache.get_or_set(("facets",), lambda: _get_facets(db), response, request)
+
+
+def _get_facets(db: Session) -> dict:
+    stats = bug_daily_stats.c
+    facets = {"statuses": [], "priorities": [], "triage_categories": [], "triage_teams": []}
+
+    # One round-trip over the daily stats view for all four dimensions
+    rows = db.execute(union_all(
+        _facet_query("statuses", stats.status),
+        _facet_query("priorities", stats.priority),
+        _facet_query("triage_categories", stats.triage_category),
+        _facet_query("triage_teams", stats.triage_team)
+    )).all()
+
+    for facet, value in rows:
+        facets[facet].append(value)
+    return facets
+
+
+def _facet_query(facet: str, column):
+    """Build the distinct non-empty values of one column, tagged for use in a UNION ALL."""
+    return select(
+        literal(facet).label("facet"),
+        column.label("value")
+    ).where(column.isnot(None), column != "").group_by(column)
 
 
 @router.post("/bugs/{jira_key}/triage")
 def triage_bug(
     jira_key: str,
+    background_tasks: BackgroundTasks,
     force: bool = Query(False, description="Force re-triage even if already triaged"),
     db: Session = Depends(get_db)
 ):
@@ -226,6 +556,7 @@ def triage_bug(
 
     Args:
         jira_key: Jira issue key (e.g., MIG-1234)
+        background_tasks: Runs the analytics refresh after the response
         force: If True, re-triage even if already triaged
         db: Database session
 
@@ -240,7 +571,7 @@ def triage_bug(
         )
 
     # Find the bug
-    bug = db.query(BugModel).filter(BugModel.jira_key == jira_key).first()
+    bug = _get_bug_by_key(db, jira_key)
     if not bug:
         raise HTTPException(status_code=404, detail=f"Bug {jira_key} not found")
 
@@ -274,16 +605,11 @@ def triage_bug(
         raise HTTPException(status_code=500, detail="Triage failed")
 
     # Update bug with triage results
-    bug.triage_category = result.category
-    bug.triage_priority = result.priority_recommendation
-    bug.triage_urgency = result.urgency
-    bug.triage_team = result.suggested_team
-    bug.triage_tags = result.tags
-    bug.triage_confidence = result.confidence
-    bug.triage_reasoning = result.reasoning
-    bug.triaged_at = datetime.now(timezone.utc)
+    _apply_triage(bug, result)
 
     db.commit()
+    # The concurrent view refresh scans all bugs, so keep it off the request path
+    background_tasks.add_task(_refresh_analytics_in_background)
 
     return {
         "status": "triaged",
@@ -340,32 +666,10 @@ def batch_triage_bugs(
             "message": "No untriaged bugs found"
         }
 
-    triaged_count = 0
-    error_count = 0
-
-    for bug in untriaged_bugs:
-        try:
-            result = triage_service.triage_bug(
-                summary=bug.summary,
-                description=bug.description,
-                current_priority=bug.priority,
-                component=bug.component,
-                labels=bug.labels
-            )
-            if result:
-                bug.triage_category = result.category
-                bug.triage_priority = result.priority_recommendation
-                bug.triage_urgency = result.urgency
-                bug.triage_team = result.suggested_team
-                bug.triage_tags = result.tags
-                bug.triage_confidence = result.confidence
-                bug.triage_reasoning = result.reasoning
-                bug.triaged_at = datetime.now(timezone.utc)
-                triaged_count += 1
-        except Exception:
-            error_count += 1
+    triaged_count, error_count = _triage_bugs(untriaged_bugs)
 
     db.commit()
+    _refresh_analytics(db)
 
     # Count remaining untriaged
     remaining = db.query(BugModel).filter(BugModel.triaged_at.is_(None)).count()
@@ -380,36 +684,46 @@ def batch_triage_bugs(
 
 
 @router.get("/bugs/triage/status")
-def get_triage_status(db: Session = Depends(get_db)):
+def get_triage_status(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get triage service status and statistics.
 
     Returns:
         Triage service status and bug triage statistics
     """
-    total_bugs = db.query(BugModel).count()
-    triaged_bugs = db.query(BugModel).filter(BugModel.triaged_at.isnot(None)).count()
+    return analytics_cache.get_or_set(
+        ("triage_status",), lambda: _get_triage_status(db), response, request
+    )
+
+
+def _get_triage_status(db: Session) -> dict:
+    stats = bug_daily_stats.c
+    totals = db.query(
+        func.coalesce(func.sum(stats.bug_count), 0),
+        func.coalesce(func.sum(stats.bug_count).filter(stats.triaged), 0)
+    ).select_from(bug_daily_stats).one()
+    total_bugs, triaged_bugs = totals
     untriaged_bugs = total_bugs - triaged_bugs
 
     # Get triage category distribution
     category_counts = {}
     categories = db.query(
-        BugModel.triage_category,
-        func.count(BugModel.id)
+        stats.triage_category,
+        func.sum(stats.bug_count)
     ).filter(
-        BugModel.triage_category.isnot(None)
-    ).group_by(BugModel.triage_category).all()
+        stats.triage_category.isnot(None)
+    ).group_by(stats.triage_category).all()
     for cat, count in categories:
         category_counts[cat] = count
 
     # Get triage team distribution
     team_counts = {}
     teams = db.query(
-        BugModel.triage_team,
-        func.count(BugModel.id)
+        stats.triage_team,
+        func.sum(stats.bug_count)
     ).filter(
-        BugModel.triage_team.isnot(None)
-    ).group_by(BugModel.triage_team).all()
+        stats.triage_team.isnot(None)
+    ).group_by(stats.triage_team).all()
     for team, count in teams:
         team_counts[team] = count
 
@@ -460,45 +774,32 @@ def incremental_sync(
         raw_bugs = jira_client.get_recently_updated_bugs(hours=hours)
         sync_log.bugs_fetched = len(raw_bugs)
 
-        # Process bugs
-        created_count = 0
-        updated_count = 0
-        bugs_to_triage = []
-
+        # Parse bugs, keeping the latest copy of any issue repeated across pages
+        parsed_bugs = {}
         for raw_bug in raw_bugs:
             bug_data = jira_client.parse_bug(raw_bug)
+            parsed_bugs[bug_data["jira_key"]] = bug_data
 
-            existing_bug = db.query(BugModel).filter(
-                BugModel.jira_key == bug_data["jira_key"]
-            ).first()
-
-            if existing_bug:
-                # Check if the bug was actually updated (compare updated_at)
-                if bug_data["updated_at"] and existing_bug.updated_at:
-                    if bug_data["updated_at"] > existing_bug.updated_at:
-                        # Update existing bug
-                        for key, value in bug_data.items():
-                            setattr(existing_bug, key, value)
-                        # Clear triage data for re-triage
-                        existing_bug.triage_category = None
-                        existing_bug.triage_priority = None
-                        existing_bug.triage_urgency = None
-                        existing_bug.triage_team = None
-                        existing_bug.triage_tags = None
-                        existing_bug.triage_confidence = None
-                        existing_bug.triage_reasoning = None
-                        existing_bug.triaged_at = None
-                        updated_count += 1
-                        bugs_to_triage.append(existing_bug)
-            else:
-                # Create new bug
-                new_bug = BugModel(**bug_data)
-                db.add(new_bug)
-                db.flush()
+        # Compare against the stored updated_at of existing bugs in one query
+        existing_updated_at = _updated_at_by_key(db, list(parsed_bugs))
+
+        created_count = 0
+        updated_count = 0
+        changed_bugs = []
+        for jira_key, bug_data in parsed_bugs.items():
+            if jira_key not in existing_updated_at:
                 created_count += 1
-                bugs_to_triage.append(new_bug)
+            else:
+                stored_updated_at = existing_updated_at[jira_key]
+                if not (bug_data["updated_at"] and stored_updated_at
+                        and bug_data["updated_at"] > stored_updated_at):
+                    continue
+                updated_count += 1
+            # Clear triage data so changed bugs are re-triaged
+            changed_bugs.append({**bug_data, **_CLEARED_TRIAGE})
 
-        db.commit()
+        # Insert new bugs and update changed ones in bulk
+        _upsert_bugs(db, changed_bugs)
         sync_log.bugs_created = created_count
         sync_log.bugs_updated = updated_count
 
@@ -506,35 +807,14 @@ def incremental_sync(
         triaged_count = 0
         triage_errors = 0
 
-        if settings.TRIAGE_ENABLED and triage_service.is_available() and bugs_to_triage:
-            for i, bug in enumerate(bugs_to_triage):
-                try:
-                    result = triage_service.triage_bug(
-                        summary=bug.summary,
-                        description=bug.description,
-                        current_priority=bug.priority,
-                        component=bug.component,
-                        labels=bug.labels
-                    )
-                    if result:
-                        bug.triage_category = result.category
-                        bug.triage_priority = result.priority_recommendation
-                        bug.triage_urgency = result.urgency
-                        bug.triage_team = result.suggested_team
-                        bug.triage_tags = result.tags
-                        bug.triage_confidence = result.confidence
-                        bug.triage_reasoning = result.reasoning
-                        bug.triaged_at = datetime.now(timezone.utc)
-                        triaged_count += 1
-
-                    # Commit in batches to avoid timeout
-                    if (i + 1) % triage_batch_size == 0:
-                        db.commit()
-
-                except Exception:
-                    triage_errors += 1
-
-            db.commit()
+        if settings.TRIAGE_ENABLED and triage_service.is_available() and changed_bugs:
+            untriaged = db.query(BugModel).filter(
+                BugModel.jira_key.in_([bug["jira_key"] for bug in changed_bugs]),
+                BugModel.triaged_at.is_(None)
+            )
+            triaged_count, triage_errors = _triage_in_batches(
+                db, untriaged, batch_size=triage_batch_size
+            )
 
         # Update sync log
         sync_log.bugs_triaged = triaged_count
@@ -542,6 +822,7 @@ def incremental_sync(
         sync_log.status = "success"
         sync_log.completed_at = datetime.now(timezone.utc)
         db.commit()
+        _refresh_analytics(db)
 
         return {
             "status": "success",
@@ -578,21 +859,40 @@ def get_sync_history(
     """
     logs = db.query(SyncLog).order_by(desc(SyncLog.started_at)).limit(limit).all()
 
+    return {"sync_history": [_sync_log_to_dict(log) for log in logs]}
+
+
+@router.get("/bugs/sync/{job_id}")
+def get_sync_job(job_id: int, db: Session = Depends(get_db)):
+    """
+    Get the status of a sync job.
+
+    Args:
+        job_id: Id returned by POST /bugs/sync
+        db: Database session
+
+    Returns:
+        Sync job status and results so far
+    """
+    sync_log = db.get(SyncLog, job_id)
+    if not sync_log:
+        raise HTTPException(status_code=404, detail=f"Sync job {job_id} not found")
+
+    return _sync_log_to_dict(sync_log)
+
+
+def _sync_log_to_dict(log: SyncLog) -> dict:
+    """Serialize a SyncLog for the sync history and job status endpoints."""
     return {
-        "sync_history": [
-            {
-                "id": log.id,
-                "sync_type": log.sync_type,
-                "status": log.status,
-                "started_at": log.started_at.isoformat() if log.started_at else None,
-                "completed_at": log.completed_at.isoformat() if log.completed_at else None,
-                "bugs_fetched": log.bugs_fetched,
-                "bugs_created": log.bugs_created,
-                "bugs_updated": log.bugs_updated,
-                "bugs_triaged": log.bugs_triaged,
-                "triage_errors": log.triage_errors,
-                "error_message": log.error_message
-            }
-            for log in logs
-        ]
+        "id": log.id,
+        "sync_type": log.sync_type,
+        "status": log.status,
+        "started_at": log.started_at.isoformat() if log.started_at else None,
+        "completed_at": log.completed_at.isoformat() if log.completed_at else None,
+        "bugs_fetched": log.bugs_fetched,
+        "bugs_created": log.bugs_created,
+        "bugs_updated": log.bugs_updated,
+        "bugs_triaged": log.bugs_triaged,
+        "triage_errors": log.triage_errors,
+        "error_message": log.error_message
     }
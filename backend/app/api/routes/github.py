@@ -1,35 +1,43 @@
 """
 GitHub integration endpoints.
 """
+import logging
 from datetime import datetime, timezone
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-
-from app.core.database import get_db
-from app.models.bug import Bug as BugModel, Commit, CommitBugLink
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import and_, desc, literal_column, or_, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.database import SessionLocal, get_db
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.bug import Bug as BugModel, Commit, CommitBugLink, SyncLog
 from app.services.github_client import github_client
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/github/sync")
+@router.post("/github/sync", status_code=202)
 def sync_github_commits(
+    background_tasks: BackgroundTasks,
     max_commits: int = Query(100, ge=1, le=500, description="Maximum commits to fetch"),
     db: Session = Depends(get_db)
 ):
     """
-    Sync commits from GitHub repository.
+    Queue a sync of commits from the GitHub repository.
+
+    The sync runs in the background after the response is sent: it fetches
+    commits, extracts Jira keys from messages, and links them to bugs.
 
-    Fetches commits, extracts Jira keys from messages, and links them to bugs.
+    Poll GET /github/sync/{job_id} for progress and results.
 
     Args:
         max_commits: Maximum number of commits to fetch
         db: Database session
 
     Returns:
-        Sync results summary
+        Job id of the queued sync
     """
     if not github_client.is_available():
         raise HTTPException(
@@ -37,109 +45,188 @@ def sync_github_commits(
             detail="GitHub integration unavailable. Set GITHUB_TOKEN environment variable."
         )
 
+    sync_log = SyncLog(sync_type="github", status="queued")
+    db.add(sync_log)
+    db.commit()
+
+    background_tasks.add_task(_run_github_sync, sync_log.id, max_commits)
+
+    return {
+        "job_id": sync_log.id,
+        "status": sync_log.status,
+        "message": f"GitHub sync queued, poll /api/github/sync/{sync_log.id} for progress"
+    }
+
+
+def _run_github_sync(job_id: int, max_commits: int) -> None:
+    """
+    Run a GitHub commit sync for a queued job, recording results on its SyncLog.
+
+    Runs outside the request, so it opens its own database session.
+    """
+    db = SessionLocal()
     try:
-        # Fetch commits from GitHub
-        raw_commits = github_client.get_all_commits(max_commits=max_commits)
-
-        created_count = 0
-        updated_count = 0
-        links_created = 0
-
-        for raw_commit in raw_commits:
-            commit_data = github_client.parse_commit(raw_commit)
-
-            # Check if commit exists
-            existing_commit = db.query(Commit).filter(
-                Commit.sha == commit_data["sha"]
-            ).first()
-
-            if existing_commit:
-                # Update existing commit (in case message was amended)
-                existing_commit.message = commit_data["message"]
-                existing_commit.message_headline = commit_data["message_headline"]
-                existing_commit.jira_keys = commit_data["jira_keys"]
-                updated_count += 1
-                commit_obj = existing_commit
-            else:
-                # Create new commit
-                commit_obj = Commit(
-                    sha=commit_data["sha"],
-                    short_sha=commit_data["short_sha"],
-                    message=commit_data["message"],
-                    message_headline=commit_data["message_headline"],
-                    author_name=commit_data["author_name"],
-                    author_email=commit_data["author_email"],
-                    authored_at=commit_data["authored_at"],
-                    url=commit_data["url"],
-                    jira_keys=commit_data["jira_keys"]
+        sync_log = db.get(SyncLog, job_id)
+        sync_log.status = "running"
+        db.commit()
+
+        try:
+            # Fetch commits from GitHub
+            raw_commits = github_client.get_all_commits(max_commits=max_commits)
+
+            # Parse commits, keeping one copy per sha
+            parsed_commits = {}
+            for raw_commit in raw_commits:
+                commit_data = github_client.parse_commit(raw_commit)
+                parsed_commits[commit_data["sha"]] = commit_data
+
+            created_count = 0
+            updated_count = 0
+            links_created = 0
+            commit_ids = {}
+
+            if parsed_commits:
+                # Upsert commits in one statement (message may have been amended)
+                stmt = insert(Commit).values(list(parsed_commits.values()))
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[Commit.sha],
+                    set_={
+                        "message": stmt.excluded.message,
+                        "message_headline": stmt.excluded.message_headline,
+                        "jira_keys": stmt.excluded.jira_keys
+                    }
+                ).returning(Commit.id, Commit.sha, literal_column("xmax = 0"))
+                for commit_id, sha, inserted in db.execute(stmt):
+                    commit_ids[sha] = commit_id
+                    if inserted:
+                        created_count += 1
+                    else:
+                        updated_count += 1
+
+            # Resolve every referenced Jira key to a bug id in one query
+            all_jira_keys = {key for c in parsed_commits.values() for key in c["jira_keys"]}
+            bug_ids = {}
+            if all_jira_keys:
+                bug_ids = dict(
+                    db.query(BugModel.jira_key, BugModel.id).filter(
+                        BugModel.jira_key.in_(all_jira_keys)
+                    ).all()
                 )
-                db.add(commit_obj)
-                db.flush()  # Get ID assigned
-                created_count += 1
-
-            # Create links to bugs for each Jira key
-            for jira_key in commit_data["jira_keys"]:
-                bug = db.query(BugModel).filter(BugModel.jira_key == jira_key).first()
-                if bug:
-                    # Check if link already exists
-                    existing_link = db.query(CommitBugLink).filter(
-                        CommitBugLink.commit_id == commit_obj.id,
-                        CommitBugLink.bug_id == bug.id
-                    ).first()
-
-                    if not existing_link:
-                        link = CommitBugLink(
-                            commit_id=commit_obj.id,
-                            bug_id=bug.id,
-                            jira_key=jira_key
-                        )
-                        db.add(link)
-                        links_created += 1
 
-        db.commit()
+            # Create missing links to bugs; existing ones are skipped by the unique index
+            new_links = [
+                {"commit_id": commit_ids[sha], "bug_id": bug_ids[jira_key], "jira_key": jira_key}
+                for sha, commit_data in parsed_commits.items()
+                for jira_key in set(commit_data["jira_keys"])
+                if jira_key in bug_ids
+            ]
+            if new_links:
+                stmt = insert(CommitBugLink).values(new_links).on_conflict_do_nothing(
+                    index_elements=[CommitBugLink.commit_id, CommitBugLink.bug_id]
+                ).returning(CommitBugLink.id)
+                links_created = len(db.execute(stmt).all())
+
+            sync_log.commits_fetched = len(raw_commits)
+            sync_log.commits_created = created_count
+            sync_log.commits_updated = updated_count
+            sync_log.links_created = links_created
+            sync_log.status = "success"
+            sync_log.completed_at = datetime.now(timezone.utc)
+            db.commit()
+
+        except Exception as e:
+            logger.error(f"GitHub sync {job_id} failed: {e}", exc_info=True)
+            db.rollback()
+            sync_log.status = "failed"
+            sync_log.error_message = str(e)
+            sync_log.completed_at = datetime.now(timezone.utc)
+            db.commit()
+    finally:
+        db.close()
+
+
+@router.get("/github/sync/{job_id}")
+def get_github_sync_job(job_id: int, db: Session = Depends(get_db)):
+    """
+    Get the status of a GitHub sync job.
 
-        return {
-            "status": "success",
-            "commits_fetched": len(raw_commits),
-            "commits_created": created_count,
-            "commits_updated": updated_count,
-            "links_created": links_created,
-            "message": f"Synced {len(raw_commits)} commits, created {links_created} bug links"
-        }
+    Args:
+        job_id: Id returned by POST /github/sync
+        db: Database session
+
+    Returns:
+        Sync job status and results
+    """
+    sync_log = db.get(SyncLog, job_id)
+    if not sync_log or sync_log.sync_type != "github":
+        raise HTTPException(status_code=404, detail=f"GitHub sync job {job_id} not found")
 
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"GitHub sync failed: {str(e)}")
+    return {
+        "id": sync_log.id,
+        "status": sync_log.status,
+        "started_at": sync_log.started_at.isoformat() if sync_log.started_at else None,
+        "completed_at": sync_log.completed_at.isoformat() if sync_log.completed_at else None,
+        "commits_fetched": sync_log.commits_fetched,
+        "commits_created": sync_log.commits_created,
+        "commits_updated": sync_log.commits_updated,
+        "links_created": sync_log.links_created,
+        "error_message": sync_log.error_message
+    }
 
 
 @router.get("/github/commits")
 def list_commits(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (replaces page)"),
     jira_key: Optional[str] = Query(None, description="Filter by Jira key"),
     db: Session = Depends(get_db)
 ):
     """
     List commits with optional filtering by Jira key.
 
+    Pages can be addressed by number, or by cursor for constant-cost deep
+    paging. Cursor pages skip the total count, so total/total_pages are null.
+
     Args:
         page: Page number
         page_size: Number of items per page
+        cursor: Opaque keyset cursor (optional)
         jira_key: Optional Jira key filter
         db: Database session
 
     Returns:
         Paginated list of commits
     """
-    query = db.query(Commit)
+    # The full message is only shown on the bug detail view
+    query = db.query(Commit).options(defer(Commit.message))
 
     if jira_key:
         query = query.filter(Commit.jira_keys.contains([jira_key]))
 
-    total = query.count()
-    commits = query.order_by(desc(Commit.authored_at)).offset(
-        (page - 1) * page_size
-    ).limit(page_size).all()
+    # Commits without an authored_at sort last; id breaks ties
+    ordered = query.order_by(Commit.authored_at.desc().nulls_last(), desc(Commit.id))
+
+    if cursor:
+        # Seek past the last row of the previous page on idx_commits_authored_id
+        cursor_authored_at, cursor_id = decode_cursor(cursor)
+        if cursor_authored_at is None:
+            after_cursor = and_(Commit.authored_at.is_(None), Commit.id < cursor_id)
+        else:
+            after_cursor = or_(
+                tuple_(Commit.authored_at, Commit.id) < (cursor_authored_at, cursor_id),
+                Commit.authored_at.is_(None)
+            )
+        commits = ordered.filter(after_cursor).limit(page_size).all()
+        page = total = total_pages = None
+    else:
+        total = query.count()
+        commits = ordered.offset((page - 1) * page_size).limit(page_size).all()
+        total_pages = (total + page_size - 1) // page_size
+
+    next_cursor = None
+    if len(commits) == page_size:
+        next_cursor = encode_cursor(commits[-1].authored_at, commits[-1].id)
 
     return {
         "commits": [
@@ -158,7 +245,8 @@ def list_commits(
         "total": total,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total + page_size - 1) // page_size
+        "total_pages": total_pages,
+        "next_cursor": next_cursor
     }
 
 
@@ -174,19 +262,23 @@ def get_bug_commits(jira_key: str, db: Session = Depends(get_db)):
     Returns:
         List of commits linked to the bug
     """
-    # Find the bug
-    bug = db.query(BugModel).filter(BugModel.jira_key == jira_key).first()
-    if not bug:
-        raise HTTPException(status_code=404, detail=f"Bug {jira_key} not found")
-
-    # Get linked commits
-    links = db.query(CommitBugLink).filter(CommitBugLink.bug_id == bug.id).all()
-    commit_ids = [link.commit_id for link in links]
-
-    commits = db.query(Commit).filter(Commit.id.in_(commit_ids)).order_by(
+    # Find the bug and its linked commits in one query; a bug without
+    # commits yields a single row with no commit
+    rows = db.query(BugModel.id, Commit).outerjoin(
+        CommitBugLink, CommitBugLink.bug_id == BugModel.id
+    ).outerjoin(
+        Commit, Commit.id == CommitBugLink.commit_id
+    ).filter(
+        BugModel.jira_key == jira_key
+    ).order_by(
         desc(Commit.authored_at)
     ).all()
 
+    if not rows:
+        raise HTTPException(status_code=404, detail=f"Bug {jira_key} not found")
+
+    commits = [commit for _, commit in rows if commit is not None]
+
     return {
         "jira_key": jira_key,
         "commit_count": len(commits),
@@ -1,33 +1,78 @@
 """
-Health check endpoint.
+Health check endpoints.
 """
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import time
+
+from fastapi import APIRouter, Response
 from sqlalchemy import text
 
-from app.core.database import get_db
+from app.core.database import engine
 
 router = APIRouter()
 
+# Seconds a database check result is reused, so bursts of probes share one query
+DB_CHECK_TTL = 2.0
+
+# (monotonic time of the last check, its status)
+_last_db_check: tuple[float, str] = (0.0, "")
+
+
+def _check_database() -> str:
+    """Run SELECT 1 against the database, reusing a result younger than DB_CHECK_TTL."""
+    global _last_db_check
+
+    checked_at, db_status = _last_db_check
+    now = time.monotonic()
+    if db_status and now - checked_at < DB_CHECK_TTL:
+        return db_status
+
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        db_status = "connected"
+    except Exception as e:
+        db_status = f"error: {str(e)}"
+
+    _last_db_check = (now, db_status)
+    return db_status
+
 
 @router.get("/health")
-def health_check(db: Session = Depends(get_db)):
+def health_check():
     """
     Health check endpoint.
-    
+
     Verifies:
     - API is responding
     - Database connection is working
     """
-    try:
-        # Test database connection
-        db.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception as e:
-        db_status = f"error: {str(e)}"
-    
+    db_status = _check_database()
+
     return {
         "status": "healthy" if db_status == "connected" else "unhealthy",
         "database": db_status,
         "api": "running"
     }
+
+
+@router.get("/health/live")
+def liveness_check():
+    """
+    Liveness probe.
+
+    Only verifies the API is responding; never touches the database.
+    """
+    return {"status": "healthy", "api": "running"}
+
+
+@router.get("/health/ready")
+def readiness_check(response: Response):
+    """
+    Readiness probe.
+
+    Same check as /health, but answers 503 while the database is unreachable.
+    """
+    result = health_check()
+    if result["status"] != "healthy":
+        response.status_code = 503
+    return result
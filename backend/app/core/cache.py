@@ -0,0 +1,164 @@
+"""
+Caching for read-heavy API responses, in-process or shared through Redis.
+"""
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+import redis
+from cachetools import TTLCache
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """Thread-safe TTL cache for computed endpoint payloads."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        response: Optional[Response] = None,
+        request: Optional[Request] = None
+    ) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Each value is stored with an ETag hashed from its JSON form. When the
+        request's If-None-Match matches it, a bodyless 304 response is returned
+        instead of the value.
+
+        Args:
+            key: Cache key, e.g. ("trends", days)
+            compute: Zero-argument callable producing the value
+            response: Optional response to tag with X-Cache HIT/MISS and ETag headers
+            request: Optional request whose If-None-Match is checked against the ETag
+
+        Returns:
+            The cached or freshly computed value, or a 304 response
+        """
+        entry = self._load(key)
+
+        hit = entry is not _MISSING
+        if not hit:
+            value = compute()
+            entry = (value, _etag(value))
+            self._store(key, entry)
+
+        value, etag = entry
+        headers = {"X-Cache": "HIT" if hit else "MISS", "ETag": etag}
+        if request is not None and _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if response is not None:
+            response.headers.update(headers)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._cache.clear()
+
+    def _load(self, key: Hashable) -> Any:
+        """Return the (value, etag) entry for key, or _MISSING."""
+        with self._lock:
+            return self._cache.get(key, _MISSING)
+
+    def _store(self, key: Hashable, entry: tuple[Any, str]) -> None:
+        """Store a (value, etag) entry for key."""
+        with self._lock:
+            self._cache[key] = entry
+
+
+class RedisResponseCache(ResponseCache):
+    """
+    Response cache shared by all API workers through Redis.
+
+    Values are stored as JSON, so hits return plain dicts/lists rather than
+    the pydantic models that produced them. clear() bumps a generation
+    counter that is part of every key instead of scanning for keys; stale
+    generations expire with the TTL. Redis errors are logged and treated as
+    misses so the endpoints keep working without the cache.
+    """
+
+    def __init__(self, client: redis.Redis, ttl: int = 60, prefix: str = "analytics"):
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    def clear(self) -> None:
+        """Drop all cached values by moving to a new key generation."""
+        try:
+            self._client.incr(f"{self._prefix}:generation")
+        except redis.RedisError as e:
+            logger.warning(f"Failed to clear Redis response cache: {e}")
+
+    def _redis_key(self, key: Hashable) -> str:
+        """Build the versioned key; reads the generation, so call it inside a RedisError guard."""
+        generation = self._client.get(f"{self._prefix}:generation") or b"0"
+        parts = key if isinstance(key, tuple) else (key,)
+        return ":".join([self._prefix, generation.decode(), *map(str, parts)])
+
+    def _load(self, key: Hashable) -> Any:
+        try:
+            redis_key = self._redis_key(key)
+            cached = self._client.get(redis_key)
+        except redis.RedisError as e:
+            logger.warning(f"Redis response cache read failed: {e}")
+            return _MISSING
+        if cached is None:
+            return _MISSING
+        data = json.loads(cached)
+        return data["value"], data["etag"]
+
+    def _store(self, key: Hashable, entry: tuple[Any, str]) -> None:
+        value, etag = entry
+        payload = json.dumps({"value": jsonable_encoder(value), "etag": etag})
+        try:
+            redis_key = self._redis_key(key)
+            self._client.setex(redis_key, self._ttl, payload)
+        except redis.RedisError as e:
+            logger.warning(f"Redis response cache write failed: {e}")
+
+
+def _etag(value: Any) -> str:
+    """Hash a JSON-serializable value into a strong ETag."""
+    payload = json.dumps(jsonable_encoder(value), sort_keys=True, separators=(",", ":"))
+    return f'"{hashlib.md5(payload.encode()).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+# Seconds to wait on Redis before treating a request as a miss, so an unreachable
+# server slows responses down slightly instead of hanging them
+REDIS_TIMEOUT = 0.5
+
+# Global cache instance for analytics responses, shared through Redis when configured
+if settings.REDIS_URL:
+    analytics_cache = RedisResponseCache(
+        redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT
+        ),
+        ttl=settings.ANALYTICS_CACHE_TTL
+    )
+else:
+    analytics_cache = ResponseCache(maxsize=128, ttl=settings.ANALYTICS_CACHE_TTL)
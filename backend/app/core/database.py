@@ -4,17 +4,31 @@ Database connection and session management.
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
 
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,
-    max_overflow=20
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # Verify connections before using
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE  # Drop connections before the server or a proxy times them out
 )
 
+
+def create_script_engine():
+    """
+    Create an unpooled engine for one-shot scripts such as migrations.
+
+    Connections are closed as soon as they are released, so a script never
+    keeps a server (or PgBouncer) slot open after it finishes.
+    """
+    return create_engine(settings.DATABASE_URL, poolclass=NullPool)
+
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,42 @@
+"""
+Shared HTTP session setup for the external API clients.
+"""
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# Transient statuses retried by the adapter; 429 and 503 honor Retry-After
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(headers: Dict[str, str], max_retries: int = 5, pool_size: int = 20) -> requests.Session:
+    """
+    Create a requests session that retries transient failures.
+
+    Retries back off exponentially (0.5s, 1s, 2s, ...) unless the server
+    sends Retry-After. Once retries are exhausted the last response is
+    returned as-is, so callers' raise_for_status() still reports it.
+
+    Args:
+        headers: Default headers for every request
+        max_retries: Maximum retries per request
+        pool_size: Connections kept per host, enough for parallel page fetches
+
+    Returns:
+        Configured session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,38 @@
+"""
+Opaque cursors for keyset pagination.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: int) -> str:
+    """
+    Encode the sort key of the last row on a page into a cursor.
+
+    Args:
+        sort_value: Timestamp the list is ordered by (may be None)
+        row_id: Primary key of the row, used as a tie-breaker
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{sort_value.isoformat() if sort_value else ''},{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[datetime], int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit(",", 1)
+        return (datetime.fromisoformat(sort_value) if sort_value else None), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
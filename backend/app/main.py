@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.database import engine, Base
@@ -37,6 +38,7 @@ app = FastAPI(
     title="Atlassian Cloud Migration Bug Dashboard API",
     description="REST API for analyzing Atlassian's public bug data",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
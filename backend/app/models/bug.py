@@ -4,11 +4,17 @@ SQLAlchemy models for bugs.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ARRAY, JSON, Index, Float
-from sqlalchemy.sql import func
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, Index, Float, Date, Boolean, DDL, event
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func, table, column
 
 from app.core.database import Base
 
+# Jira statuses counted as open by Bug.is_open
+OPEN_STATUSES = frozenset({"Open", "In Progress", "Reopened", "To Do"})
+
 
 class Bug(Base):
     """Bug model representing a Jira bug issue."""
@@ -38,14 +44,14 @@ class Bug(Base):
 
     # Categorization
     component = Column(String(200), nullable=True)
-    labels = Column(ARRAY(String), nullable=True)
+    labels = Column(JSONB, nullable=True)  # JSON array of strings
 
     # People
     reporter = Column(String(200), nullable=True)
     assignee = Column(String(200), nullable=True)
 
     # Raw data for reference
-    raw_data = Column(JSON, nullable=True)
+    raw_data = Column(JSONB, nullable=True)
 
     # Metadata
     fetched_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -55,7 +61,7 @@ class Bug(Base):
     triage_priority = Column(String(20), nullable=True)  # critical, high, medium, low
     triage_urgency = Column(String(20), nullable=True)  # immediate, soon, normal, backlog
     triage_team = Column(String(50), nullable=True, index=True)  # frontend, backend, etc.
-    triage_tags = Column(ARRAY(String), nullable=True)
+    triage_tags = Column(JSONB, nullable=True)  # JSON array of strings
     triage_confidence = Column(Float, nullable=True)  # 0.0 to 1.0
     triage_reasoning = Column(Text, nullable=True)
     triaged_at = Column(DateTime(timezone=True), nullable=True)
@@ -66,8 +72,7 @@ class Bug(Base):
     @property
     def is_open(self) -> bool:
         """Check if bug is still open."""
-        open_statuses = ["Open", "In Progress", "Reopened", "To Do"]
-        return self.status in open_statuses
+        return self.status in OPEN_STATUSES
     
     @property
     def resolution_time_days(self) -> Optional[int]:
@@ -81,6 +86,106 @@ class Bug(Base):
 # Indexes for common queries
 Index("idx_bugs_status_priority", Bug.status, Bug.priority)
 Index("idx_bugs_created_updated", Bug.created_at, Bug.updated_at)
+# Trigram index so summary ILIKE '%term%' searches avoid a sequential scan
+Index(
+    "idx_bugs_summary_trgm", Bug.summary,
+    postgresql_using="gin", postgresql_ops={"summary": "gin_trgm_ops"}
+)
+event.listen(Bug.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+# Expression indexes backing the /analytics/trends groupings. Timestamps are shifted
+# to UTC first because date()/date_trunc() on timestamptz aren't immutable.
+Index(
+    "idx_bugs_resolved_day", func.date(func.timezone("UTC", Bug.resolved_at)),
+    postgresql_where=Bug.resolved_at.isnot(None)
+)
+Index("idx_bugs_updated_week_status", func.date_trunc("week", func.timezone("UTC", Bug.updated_at)), Bug.status)
+# Keyset pagination order for list_bugs, unfiltered and filtered by status or priority
+Index("idx_bugs_updated_id", Bug.updated_at.desc(), Bug.id.desc())
+Index("idx_bugs_status_updated_id", Bug.status, Bug.updated_at.desc(), Bug.id.desc())
+Index("idx_bugs_priority_updated_id", Bug.priority, Bug.updated_at.desc(), Bug.id.desc())
+# Partial index of the untriaged backlog, walked in id order by batch triage
+Index("idx_bugs_untriaged_id", Bug.id, postgresql_where=Bug.triaged_at.is_(None))
+# Containment (@>) lookups into the raw Jira payload
+Index(
+    "idx_bugs_raw_data_gin", Bug.raw_data,
+    postgresql_using="gin", postgresql_ops={"raw_data": "jsonb_path_ops"}
+)
+# Partial covering index so the resolution-time aggregates only read resolved bugs
+Index(
+    "idx_bugs_resolved", Bug.priority, Bug.created_at, Bug.resolved_at,
+    postgresql_where=Bug.resolved_at.isnot(None)
+)
+
+
+# Materialized view of bug counts per day and dashboard dimension. Analytics endpoints
+# aggregate over this instead of scanning the bugs table; it is refreshed after syncs
+# and triage runs, which are the only writers. Days are UTC, like the /analytics/trends
+# expression indexes, so created and resolved series share day boundaries.
+bug_daily_stats = table(
+    "bug_daily_stats",
+    column("day", Date),
+    column("status", String),
+    column("status_category", String),
+    column("priority", String),
+    column("triage_team", String),
+    column("triage_category", String),
+    column("triaged", Boolean),
+    column("bug_count", Integer),
+)
+
+event.listen(Base.metadata, "after_create", DDL("""
+CREATE MATERIALIZED VIEW IF NOT EXISTS bug_daily_stats AS
+SELECT
+    date(timezone('UTC', created_at)) AS day,
+    status,
+    status_category,
+    priority,
+    triage_team,
+    triage_category,
+    triaged_at IS NOT NULL AS triaged,
+    count(*)::integer AS bug_count
+FROM bugs
+GROUP BY 1, 2, 3, 4, 5, 6, 7
+"""))
+
+# Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+event.listen(Base.metadata, "after_create", DDL("""
+CREATE UNIQUE INDEX IF NOT EXISTS idx_bug_daily_stats_groups ON bug_daily_stats
+    (day, status, status_category, priority, triage_team, triage_category, triaged)
+"""))
+
+
+# Single-row materialized view of the overview scalars that need per-bug timestamps
+# (resolution times and 7-day activity). Refreshed together with bug_daily_stats, so
+# recent_count is as of the last write, see refreshed_at.
+bug_overview_stats = table(
+    "bug_overview_stats",
+    column("avg_resolution_days", Float),
+    column("p50_resolution_days", Float),
+    column("p90_resolution_days", Float),
+    column("recent_count", Integer),
+    column("refreshed_at", DateTime),
+)
+
+event.listen(Base.metadata, "after_create", DDL("""
+CREATE MATERIALIZED VIEW IF NOT EXISTS bug_overview_stats AS
+WITH resolution AS (
+    SELECT extract(epoch FROM resolved_at - created_at)::float / 86400 AS days
+    FROM bugs
+    WHERE resolved_at IS NOT NULL
+)
+SELECT
+    1 AS id,
+    (SELECT avg(days) FROM resolution) AS avg_resolution_days,
+    (SELECT percentile_cont(0.5) WITHIN GROUP (ORDER BY days) FROM resolution) AS p50_resolution_days,
+    (SELECT percentile_cont(0.9) WITHIN GROUP (ORDER BY days) FROM resolution) AS p90_resolution_days,
+    (SELECT count(*)::integer FROM bugs WHERE updated_at >= now() - interval '7 days') AS recent_count,
+    now() AS refreshed_at
+"""))
+
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_bug_overview_stats_id ON bug_overview_stats (id)"
+))
 
 
 class SyncLog(Base):
@@ -89,10 +194,10 @@ class SyncLog(Base):
     __tablename__ = "sync_logs"
 
     id = Column(Integer, primary_key=True, index=True)
-    sync_type = Column(String(50), nullable=False)  # "full", "incremental"
+    sync_type = Column(String(50), nullable=False)  # "full", "incremental", "github"
     started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
-    status = Column(String(20), nullable=False, default="running")  # running, success, failed
+    status = Column(String(20), nullable=False, default="running")  # queued, running, success, failed
 
     # Results
     bugs_fetched = Column(Integer, default=0)
@@ -101,6 +206,12 @@ class SyncLog(Base):
     bugs_triaged = Column(Integer, default=0)
     triage_errors = Column(Integer, default=0)
 
+    # GitHub sync results
+    commits_fetched = Column(Integer, default=0)
+    commits_created = Column(Integer, default=0)
+    commits_updated = Column(Integer, default=0)
+    links_created = Column(Integer, default=0)
+
     # Error tracking
     error_message = Column(Text, nullable=True)
 
@@ -128,7 +239,7 @@ class Commit(Base):
     url = Column(String(500), nullable=True)
 
     # Linked Jira keys (stored as array for quick access)
-    jira_keys = Column(ARRAY(String), nullable=True)
+    jira_keys = Column(JSONB, nullable=True)
 
     # Metadata
     fetched_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -137,6 +248,12 @@ class Commit(Base):
         return f"<Commit {self.short_sha}: {self.message_headline[:50]}>"
 
 
+# Keyset pagination order for list_commits
+Index("idx_commits_authored_id", Commit.authored_at.desc().nulls_last(), Commit.id.desc())
+# GIN index so jira_keys @> '["KEY"]' containment filters avoid a sequential scan
+Index("idx_commits_jira_keys_gin", Commit.jira_keys, postgresql_using="gin")
+
+
 class CommitBugLink(Base):
     """Many-to-many link between commits and bugs."""
 
@@ -53,10 +53,19 @@ class BugUpdate(BaseModel):
     assignee: Optional[str] = None
 
 
-class Bug(BugBase):
-    """Complete bug schema for API responses."""
+class BugListItem(BaseModel):
+    """Bug schema for list responses (omits the description)."""
     id: int
+    jira_key: str
     jira_id: Optional[str] = None
+    summary: str
+    status: str
+    status_category: Optional[str] = None
+    priority: Optional[str] = None
+    component: Optional[str] = None
+    reporter: Optional[str] = None
+    assignee: Optional[str] = None
+    labels: Optional[list[str]] = None
     created_at: datetime
     updated_at: datetime
     resolved_at: Optional[datetime] = None
@@ -75,13 +84,19 @@ class Bug(BugBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class Bug(BugListItem):
+    """Complete bug schema for API responses."""
+    description: Optional[str] = None
+
+
 class BugList(BaseModel):
     """Schema for paginated bug list."""
-    bugs: list[Bug]
-    total: int
-    page: int
+    bugs: list[BugListItem]
+    total: Optional[int] = None  # None for cursor pages
+    page: Optional[int] = None  # None for cursor pages
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None  # None for cursor pages
+    next_cursor: Optional[str] = None
 
 
 class BugStats(BaseModel):
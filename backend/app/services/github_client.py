@@ -3,18 +3,21 @@ GitHub API client for fetching commit data.
 """
 import logging
 import re
-from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime
 
-import requests
+import orjson
 from requests.exceptions import RequestException
 
 from app.core.config import settings
+from app.core.http import create_session
 
 logger = logging.getLogger(__name__)
 
-# Regex pattern to match Jira keys (e.g., MIG-1234, CLOUD-567)
-JIRA_KEY_PATTERN = re.compile(r'\b([A-Z]+-\d+)\b')
+# Regex pattern to match Jira keys of the configured project (e.g., MIG-1234)
+JIRA_KEY_PATTERN = re.compile(rf'\b({re.escape(settings.JIRA_PROJECT)}-\d+)\b')
 
 
 class GitHubClient:
@@ -24,8 +27,8 @@ class GitHubClient:
         self.base_url = "https://api.github.com"
         self.owner = settings.GITHUB_REPO_OWNER
         self.repo = settings.GITHUB_REPO_NAME
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_concurrent_pages = 4
+        self.session = create_session({
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28"
         })
@@ -71,12 +74,12 @@ class GitHubClient:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            commits = response.json()
+            commits = orjson.loads(response.content)
             logger.info(f"Fetched {len(commits)} commits")
 
             return commits
 
-        except RequestException as e:
+        except (RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to fetch commits from GitHub: {e}")
             raise
 
@@ -88,6 +91,9 @@ class GitHubClient:
         """
         Fetch all commits with pagination.
 
+        The pages needed to reach max_commits are requested in parallel and
+        read back in order, stopping at the first short (last) page.
+
         Args:
             since: Only commits after this date (ISO 8601 format)
             max_commits: Maximum number of commits to fetch
@@ -96,21 +102,30 @@ class GitHubClient:
             List of commit dictionaries
         """
         all_commits = []
-        page = 1
+        pages = range(1, (max_commits + 99) // 100 + 1)
 
-        while len(all_commits) < max_commits:
-            commits = self.get_commits(per_page=100, page=page, since=since)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_pages) as executor:
+            futures = [
+                executor.submit(self.get_commits, per_page=100, page=page, since=since)
+                for page in pages
+            ]
+            try:
+                for future in futures:
+                    commits = future.result()
 
-            if not commits:
-                break
+                    if not commits:
+                        break
 
-            all_commits.extend(commits)
-            page += 1
+                    all_commits.extend(commits)
 
-            logger.info(f"Progress: {len(all_commits)} commits fetched")
+                    logger.info(f"Progress: {len(all_commits)} commits fetched")
 
-            if len(commits) < 100:  # Last page
-                break
+                    if len(commits) < 100:  # Last page
+                        break
+            finally:
+                # Pages past the end of history are no longer needed
+                for future in futures:
+                    future.cancel()
 
         return all_commits[:max_commits]
 
@@ -130,10 +145,8 @@ class GitHubClient:
         sha = commit.get("sha", "")
         message = commit_data.get("message", "")
 
-        # Extract Jira keys from commit message
-        jira_keys = JIRA_KEY_PATTERN.findall(message)
-        # Filter to only include keys from configured project (MIG)
-        jira_keys = [key for key in jira_keys if key.startswith(settings.JIRA_PROJECT)]
+        # Extract Jira keys of the configured project from the commit message
+        jira_keys = list(self.extract_jira_keys(message))
 
         # Parse author date
         author_date = None
@@ -156,18 +169,21 @@ class GitHubClient:
         }
 
     @staticmethod
-    def extract_jira_keys(text: str) -> List[str]:
+    @lru_cache(maxsize=8192)
+    def extract_jira_keys(text: str) -> Tuple[str, ...]:
         """
         Extract Jira keys from any text.
 
+        Results are memoized: each GitHub sync re-reads mostly the same
+        recent commits, so their messages are only scanned once.
+
         Args:
             text: Text to search for Jira keys
 
         Returns:
-            List of Jira keys found
+            Tuple of unique Jira keys found, in order of first mention
         """
-        keys = JIRA_KEY_PATTERN.findall(text)
-        return [key for key in keys if key.startswith(settings.JIRA_PROJECT)]
+        return tuple(dict.fromkeys(JIRA_KEY_PATTERN.findall(text)))
 
 
 # Global client instance
@@ -2,13 +2,16 @@
 Jira REST API client for fetching bug data.
 """
 import logging
-from typing import Optional, Dict, List, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Iterator
 from datetime import datetime
 
-import requests
+import orjson
 from requests.exceptions import RequestException
 
 from app.core.config import settings
+from app.core.http import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +23,8 @@ class JiraClient:
         self.base_url = settings.JIRA_BASE_URL
         self.project = settings.JIRA_PROJECT
         self.issue_type = settings.JIRA_ISSUE_TYPE
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_concurrent_pages = 4
+        self.session = create_session({
             "Content-Type": "application/json",
             "Accept": "application/json"
         })
@@ -71,18 +74,87 @@ class JiraClient:
         
         try:
             logger.info(f"Fetching bugs: {jql}")
+            # Rate limits and transient 5xx errors are retried by the session
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Fetched {len(data.get('issues', []))} bugs (total: {data.get('total', 0)})")
             
             return data
             
-        except RequestException as e:
+        except (RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Failed to fetch bugs from Jira: {e}")
             raise
-    
+
+    def iter_bug_pages(
+        self,
+        batch_size: int = 100,
+        status_filter: Optional[str] = None,
+        updated_since: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield matching bugs one page at a time.
+
+        Lets callers process and persist each page before fetching the next,
+        so memory stays bounded by the page size. Once the first page reveals
+        the total, up to max_concurrent_pages later pages are fetched ahead
+        in parallel; pages are still yielded in order.
+
+        Args:
+            batch_size: Number of bugs to fetch per request
+            status_filter: Optional status filter (e.g., "!=Done" for open bugs only)
+            updated_since: Optional JQL date filter (e.g., "-24h")
+
+        Yields:
+            Lists of raw bug dictionaries
+        """
+        def fetch_page(start_at: int) -> Dict[str, Any]:
+            return self.search_bugs(
+                max_results=batch_size,
+                start_at=start_at,
+                status_filter=status_filter,
+                updated_since=updated_since
+            )
+
+        response = fetch_page(0)
+        issues = response.get("issues", [])
+        if not issues:
+            return
+
+        yield issues
+
+        total = response.get("total", 0)
+        fetched = len(issues)
+        logger.info(f"Progress: {fetched}/{total} bugs fetched")
+
+        # Jira may cap maxResults below the requested batch size
+        page_size = response.get("maxResults") or len(issues)
+        start_ats = iter(range(page_size, total, page_size))
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent_pages)
+        try:
+            pending = deque(
+                executor.submit(fetch_page, start_at)
+                for _, start_at in zip(range(self.max_concurrent_pages), start_ats)
+            )
+            while pending:
+                issues = pending.popleft().result().get("issues", [])
+                if not issues:
+                    break
+
+                # Keep the window full before handing the page to the caller
+                next_start_at = next(start_ats, None)
+                if next_start_at is not None:
+                    pending.append(executor.submit(fetch_page, next_start_at))
+
+                yield issues
+
+                fetched += len(issues)
+                logger.info(f"Progress: {fetched}/{total} bugs fetched")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_all_bugs(self, batch_size: int = 100, status_filter: Optional[str] = "!=Done") -> List[Dict[str, Any]]:
         """
         Fetch all bugs with pagination.
@@ -94,32 +166,11 @@ class JiraClient:
         Returns:
             List of bug dictionaries
         """
-        all_bugs = []
-        start_at = 0
-        
-        while True:
-            response = self.search_bugs(
-                max_results=batch_size,
-                start_at=start_at,
-                status_filter=status_filter
-            )
-            
-            issues = response.get("issues", [])
-            if not issues:
-                break
-            
-            all_bugs.extend(issues)
-            
-            total = response.get("total", 0)
-            start_at += len(issues)
-            
-            logger.info(f"Progress: {len(all_bugs)}/{total} bugs fetched")
-            
-            # Check if we've fetched everything
-            if len(all_bugs) >= total:
-                break
-        
-        return all_bugs
+        return [
+            bug
+            for page in self.iter_bug_pages(batch_size=batch_size, status_filter=status_filter)
+            for bug in page
+        ]
 
     def get_recently_updated_bugs(
         self, hours: int = 24, batch_size: int = 100
@@ -134,33 +185,11 @@ class JiraClient:
         Returns:
             List of bug dictionaries
         """
-        all_bugs = []
-        start_at = 0
-        updated_since = f"-{hours}h"
-
-        while True:
-            response = self.search_bugs(
-                max_results=batch_size,
-                start_at=start_at,
-                status_filter=None,  # Get all statuses
-                updated_since=updated_since
-            )
-
-            issues = response.get("issues", [])
-            if not issues:
-                break
-
-            all_bugs.extend(issues)
-
-            total = response.get("total", 0)
-            start_at += len(issues)
-
-            logger.info(f"Progress: {len(all_bugs)}/{total} recently updated bugs fetched")
-
-            if len(all_bugs) >= total:
-                break
-
-        return all_bugs
+        return [
+            bug
+            for page in self.iter_bug_pages(batch_size=batch_size, updated_since=f"-{hours}h")
+            for bug in page
+        ]
 
     def parse_bug(self, issue: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -228,8 +257,8 @@ class JiraClient:
             return None
         
         try:
-            # Jira format: 2024-01-24T10:30:00.000+0000
-            return datetime.fromisoformat(date_str.replace("+0000", "+00:00"))
+            # Jira format: 2024-01-24T10:30:00.000+0000 (parsed natively since Python 3.11)
+            return datetime.fromisoformat(date_str)
         except (ValueError, AttributeError) as e:
             logger.warning(f"Failed to parse datetime '{date_str}': {e}")
             return None
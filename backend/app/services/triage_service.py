@@ -1,11 +1,13 @@
 """
 Automatic ticket triage service using Claude Haiku.
 """
+import asyncio
 import logging
 from typing import Optional
 from pydantic import BaseModel
 
 import anthropic
+import orjson
 
 from app.core.config import settings
 
@@ -26,18 +28,11 @@ class TriageResult(BaseModel):
 class TriageService:
     """Service for automatic ticket triage using Claude Haiku."""
 
-    TRIAGE_PROMPT = """You are an expert bug triage specialist for a software development team. Analyze the following bug ticket and provide a structured triage assessment.
+    # Fixed instructions, sent once per request as the system prompt; only the
+    # ticket section built by _build_prompt varies between bugs
+    TRIAGE_PROMPT_INTRO = "You are an expert bug triage specialist for a software development team. Analyze the bug ticket you are given and provide a structured triage assessment."
 
-## Bug Ticket
-**Summary:** {summary}
-
-**Description:** {description}
-
-**Current Priority (from Jira):** {current_priority}
-**Component:** {component}
-**Labels:** {labels}
-
-## Your Task
+    TRIAGE_PROMPT_TASK = """## Your Task
 Analyze this ticket and provide triage information. Consider:
 1. **Category**: What type of issue is this? (bug, feature_request, documentation, performance, security, ui_ux, data_issue, integration)
 2. **Priority Recommendation**: Based on potential impact and severity (critical, high, medium, low)
@@ -48,7 +43,7 @@ Analyze this ticket and provide triage information. Consider:
 7. **Reasoning**: Brief 1-2 sentence explanation
 
 Respond with ONLY valid JSON matching this exact structure:
-{{
+{
   "category": "string",
   "priority_recommendation": "string",
   "urgency": "string",
@@ -56,7 +51,11 @@ Respond with ONLY valid JSON matching this exact structure:
   "tags": ["string"],
   "confidence": 0.0,
   "reasoning": "string"
-}}"""
+}"""
+
+    # Not marked for prompt caching: at a few hundred tokens it is well below the
+    # minimum cacheable prompt length, so a cache breakpoint would be ignored
+    TRIAGE_SYSTEM = f"{TRIAGE_PROMPT_INTRO}\n\n{TRIAGE_PROMPT_TASK}"
 
     def __init__(self):
         self.client = None
@@ -109,46 +108,20 @@ Respond with ONLY valid JSON matching this exact structure:
         if not self._ensure_client():
             return None
 
-        # Prepare the prompt
-        prompt = self.TRIAGE_PROMPT.format(
-            summary=summary,
-            description=description or "No description provided",
-            current_priority=current_priority or "Not set",
-            component=component or "Not assigned",
-            labels=", ".join(labels) if labels else "None"
-        )
+        prompt = self._build_prompt(summary, description, current_priority, component, labels)
 
         try:
             message = self.client.messages.create(
                 model="claude-haiku-4-5",
                 max_tokens=500,
+                system=self.TRIAGE_SYSTEM,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
+            return self._parse_response(message.content[0].text)
 
-            # Parse the response
-            response_text = message.content[0].text
-
-            # Parse JSON from response
-            import json
-            triage_data = json.loads(response_text)
-
-            # Validate and create result
-            result = TriageResult(
-                category=triage_data.get("category", "unknown"),
-                priority_recommendation=triage_data.get("priority_recommendation", "medium"),
-                urgency=triage_data.get("urgency", "normal"),
-                suggested_team=triage_data.get("suggested_team", "unassigned"),
-                tags=triage_data.get("tags", []),
-                confidence=min(1.0, max(0.0, float(triage_data.get("confidence", 0.5)))),
-                reasoning=triage_data.get("reasoning", "")
-            )
-
-            logger.info(f"Triaged bug: category={result.category}, priority={result.priority_recommendation}")
-            return result
-
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse triage response as JSON: {e}")
             return None
         except anthropic.APIError as e:
@@ -160,35 +133,137 @@ Respond with ONLY valid JSON matching this exact structure:
 
     def triage_bugs_batch(
         self,
-        bugs: list[dict]
+        bugs: list[dict],
+        concurrency: Optional[int] = None
     ) -> dict[str, Optional[TriageResult]]:
         """
-        Triage multiple bugs.
+        Triage multiple bugs concurrently.
+
+        Requests are issued from an AsyncAnthropic client and overlapped on an
+        event loop, with at most `concurrency` in flight at once.
 
         Args:
             bugs: List of bug dictionaries with keys: jira_key, summary, description, priority, component, labels
+            concurrency: Max concurrent requests (default: TRIAGE_CONCURRENCY setting)
 
         Returns:
             Dictionary mapping jira_key to TriageResult (or None if triage failed)
         """
-        results = {}
-
-        for bug in bugs:
-            jira_key = bug.get("jira_key", "unknown")
-            result = self.triage_bug(
-                summary=bug.get("summary", ""),
-                description=bug.get("description"),
-                current_priority=bug.get("priority"),
-                component=bug.get("component"),
-                labels=bug.get("labels")
-            )
-            results[jira_key] = result
+        if not bugs or not self._ensure_client():
+            return {bug.get("jira_key", "unknown"): None for bug in bugs}
+
+        results = asyncio.run(
+            self._triage_bugs_async(bugs, concurrency or settings.TRIAGE_CONCURRENCY)
+        )
 
         triaged_count = sum(1 for r in results.values() if r is not None)
         logger.info(f"Batch triage complete: {triaged_count}/{len(bugs)} bugs triaged")
 
         return results
 
+    async def _triage_bugs_async(
+        self,
+        bugs: list[dict],
+        concurrency: int
+    ) -> dict[str, Optional[TriageResult]]:
+        """Triage bugs on the running event loop, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # The async client is scoped to this event loop; asyncio.run closes the loop afterwards
+        async with anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY) as client:
+            async def triage(bug: dict) -> Optional[TriageResult]:
+                async with semaphore:
+                    return await self._triage_bug_async(client, bug)
+
+            # One failed task must not cancel or discard the rest of the batch
+            results = await asyncio.gather(
+                *(triage(bug) for bug in bugs), return_exceptions=True
+            )
+
+        triaged = {}
+        for bug, result in zip(bugs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Triage task for {bug.get('jira_key', 'unknown')} failed: {result}")
+                result = None
+            triaged[bug.get("jira_key", "unknown")] = result
+        return triaged
+
+    async def _triage_bug_async(
+        self,
+        client: anthropic.AsyncAnthropic,
+        bug: dict
+    ) -> Optional[TriageResult]:
+        """Async counterpart of triage_bug for one bug dictionary."""
+        prompt = self._build_prompt(
+            bug.get("summary", ""),
+            bug.get("description"),
+            bug.get("priority"),
+            bug.get("component"),
+            bug.get("labels")
+        )
+
+        try:
+            message = await client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=500,
+                system=self.TRIAGE_SYSTEM,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            return self._parse_response(message.content[0].text)
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse triage response as JSON: {e}")
+            return None
+        except anthropic.APIError as e:
+            logger.error(f"Anthropic API error during triage: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error during triage: {e}")
+            return None
+
+    def _build_prompt(
+        self,
+        summary: str,
+        description: Optional[str],
+        current_priority: Optional[str],
+        component: Optional[str],
+        labels: Optional[list[str]]
+    ) -> str:
+        """Build the per-bug ticket section of the triage prompt."""
+        description = description or "No description provided"
+        current_priority = current_priority or "Not set"
+        component = component or "Not assigned"
+        labels = ", ".join(labels) if labels else "None"
+
+        return (
+            f"## Bug Ticket\n"
+            f"**Summary:** {summary}\n\n"
+            f"**Description:** {description}\n\n"
+            f"**Current Priority (from Jira):** {current_priority}\n"
+            f"**Component:** {component}\n"
+            f"**Labels:** {labels}"
+        )
+
+    def _parse_response(self, response_text: str) -> TriageResult:
+        """Parse Claude's JSON reply into a TriageResult."""
+        triage_data = orjson.loads(response_text)
+
+        # Validate and create result
+        result = TriageResult(
+            category=triage_data.get("category", "unknown"),
+            priority_recommendation=triage_data.get("priority_recommendation", "medium"),
+            urgency=triage_data.get("urgency", "normal"),
+            suggested_team=triage_data.get("suggested_team", "unassigned"),
+            tags=triage_data.get("tags", []),
+            confidence=min(1.0, max(0.0, float(triage_data.get("confidence", 0.5)))),
+            reasoning=triage_data.get("reasoning", "")
+        )
+
+        logger.info(f"Triaged bug: category={result.category}, priority={result.priority_recommendation}")
+        return result
+
 
 # Global service instance
 triage_service = TriageService()
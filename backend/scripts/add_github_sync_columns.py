@@ -0,0 +1,43 @@
+"""
+Migration script to add GitHub sync result columns to the sync_logs table.
+Run this script after updating to queue GitHub syncs as background jobs.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import create_script_engine
+
+engine = create_script_engine()
+
+
+def add_github_sync_columns():
+    """Add GitHub sync result columns to sync_logs table."""
+    print("Adding GitHub sync columns to sync_logs table...")
+
+    # SQL statements to add new columns (IF NOT EXISTS for idempotency)
+    alter_statements = [
+        "ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS commits_fetched INTEGER DEFAULT 0",
+        "ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS commits_created INTEGER DEFAULT 0",
+        "ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS commits_updated INTEGER DEFAULT 0",
+        "ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS links_created INTEGER DEFAULT 0",
+    ]
+
+    with engine.connect() as conn:
+        for stmt in alter_statements:
+            try:
+                conn.execute(text(stmt))
+                print(f"  ✓ {stmt.split('ADD COLUMN IF NOT EXISTS ')[1].split()[0]}")
+            except Exception as e:
+                print(f"  ⚠ Warning: {e}")
+
+        conn.commit()
+
+    print("\n✅ GitHub sync columns migration complete!")
+
+
+if __name__ == "__main__":
+    add_github_sync_columns()
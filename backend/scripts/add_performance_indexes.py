@@ -0,0 +1,79 @@
+"""
+Migration script to add query performance indexes to existing databases.
+Run this script after updating; new databases get these indexes from init_db.py.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import create_script_engine
+
+engine = create_script_engine()
+
+
+def add_performance_indexes():
+    """Add performance indexes to the bugs and commits tables."""
+    print("Adding performance indexes...")
+
+    # Extensions required by the indexes below
+    extension_statements = [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    ]
+
+    # Indexes (IF NOT EXISTS for idempotency)
+    index_statements = [
+        # Trigram index for summary ILIKE '%term%' search
+        "CREATE INDEX IF NOT EXISTS idx_bugs_summary_trgm ON bugs USING gin (summary gin_trgm_ops)",
+        # Expression indexes for /analytics/trends daily and weekly groupings
+        "CREATE INDEX IF NOT EXISTS idx_bugs_resolved_day ON bugs (date(timezone('UTC', resolved_at))) WHERE resolved_at IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS idx_bugs_updated_week_status ON bugs (date_trunc('week', timezone('UTC', updated_at)), status)",
+        # Partial covering index for resolution-time aggregates
+        "CREATE INDEX IF NOT EXISTS idx_bugs_resolved ON bugs (priority, created_at, resolved_at) WHERE resolved_at IS NOT NULL",
+        # Partial index of untriaged bugs for batch triage
+        "CREATE INDEX IF NOT EXISTS idx_bugs_untriaged_id ON bugs (id) WHERE triaged_at IS NULL",
+        # Keyset pagination order for the bug and commit lists
+        "CREATE INDEX IF NOT EXISTS idx_bugs_updated_id ON bugs (updated_at DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_bugs_status_updated_id ON bugs (status, updated_at DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_bugs_priority_updated_id ON bugs (priority, updated_at DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_commits_authored_id ON commits (authored_at DESC NULLS LAST, id DESC)",
+        # GIN index for commits.jira_keys containment filters
+        "CREATE INDEX IF NOT EXISTS idx_commits_jira_keys_gin ON commits USING gin (jira_keys)",
+    ]
+
+    failed = []
+
+    # Each statement is committed or rolled back on its own, so one failure
+    # doesn't abort the transaction for every statement after it
+    with engine.connect() as conn:
+        for stmt in extension_statements:
+            try:
+                conn.execute(text(stmt))
+                conn.commit()
+                print(f"  ✓ Extension: {stmt.split('EXTENSION IF NOT EXISTS ')[1]}")
+            except Exception as e:
+                print(f"  ⚠ Warning: {e}")
+                conn.rollback()
+                failed.append(stmt)
+
+        for stmt in index_statements:
+            idx_name = stmt.split("INDEX IF NOT EXISTS ")[1].split()[0]
+            try:
+                conn.execute(text(stmt))
+                conn.commit()
+                print(f"  ✓ Index: {idx_name}")
+            except Exception as e:
+                print(f"  ⚠ Warning: {e}")
+                conn.rollback()
+                failed.append(idx_name)
+
+    if failed:
+        print(f"\n❌ Performance indexes migration failed for {len(failed)} statement(s)")
+        sys.exit(1)
+
+    print("\n✅ Performance indexes migration complete!")
+
+if __name__ == "__main__":
+    add_performance_indexes()
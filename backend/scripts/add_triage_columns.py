@@ -9,49 +9,94 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import text
-from app.core.database import engine
+from app.core.database import create_script_engine
+
+engine = create_script_engine()
+
+# New columns, added by a single ALTER TABLE (IF NOT EXISTS for idempotency)
+# so the table lock is taken and the catalog updated only once
+TRIAGE_COLUMNS = [
+    ("triage_category", "VARCHAR(50)"),
+    ("triage_priority", "VARCHAR(20)"),
+    ("triage_urgency", "VARCHAR(20)"),
+    ("triage_team", "VARCHAR(50)"),
+    ("triage_tags", "JSONB"),
+    ("triage_confidence", "FLOAT"),
+    ("triage_reasoning", "TEXT"),
+    ("triaged_at", "TIMESTAMP WITH TIME ZONE"),
+]
+
+# (index, column) for commonly queried triage fields. Built CONCURRENTLY so the
+# sync can keep writing to bugs meanwhile.
+TRIAGE_INDEXES = [
+    ("idx_bugs_triage_category", "triage_category"),
+    ("idx_bugs_triage_team", "triage_team"),
+    ("idx_bugs_triage_priority", "triage_priority"),
+]
 
 
 def add_triage_columns():
     """Add AI triage columns to bugs table."""
     print("Adding triage columns to bugs table...")
 
-    # SQL statements to add new columns (IF NOT EXISTS for idempotency)
-    alter_statements = [
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_category VARCHAR(50)",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_priority VARCHAR(20)",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_urgency VARCHAR(20)",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_team VARCHAR(50)",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_tags VARCHAR(100)[]",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_confidence FLOAT",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triage_reasoning TEXT",
-        "ALTER TABLE bugs ADD COLUMN IF NOT EXISTS triaged_at TIMESTAMP WITH TIME ZONE",
-    ]
+    # Preflight: one catalog round trip, so an already-migrated table gets no DDL at all
+    with engine.connect() as conn:
+        existing_columns, existing_indexes = conn.execute(
+            text("""
+                SELECT
+                    ARRAY(SELECT column_name::text FROM information_schema.columns
+                          WHERE table_name = 'bugs' AND column_name = ANY(:columns)),
+                    ARRAY(SELECT indexname::text FROM pg_indexes
+                          WHERE tablename = 'bugs' AND indexname = ANY(:indexes))
+            """),
+            {
+                "columns": [name for name, _ in TRIAGE_COLUMNS],
+                "indexes": [name for name, _ in TRIAGE_INDEXES],
+            }
+        ).one()
+
+    missing_columns = [(name, column_type) for name, column_type in TRIAGE_COLUMNS if name not in existing_columns]
+    missing_indexes = [(name, col) for name, col in TRIAGE_INDEXES if name not in existing_indexes]
 
-    # Create indexes for commonly queried triage fields
-    index_statements = [
-        "CREATE INDEX IF NOT EXISTS idx_bugs_triage_category ON bugs(triage_category)",
-        "CREATE INDEX IF NOT EXISTS idx_bugs_triage_team ON bugs(triage_team)",
-        "CREATE INDEX IF NOT EXISTS idx_bugs_triage_priority ON bugs(triage_priority)",
+    if not missing_columns and not missing_indexes:
+        print("  Already migrated, nothing to do")
+        return
+
+    preflight_report = {
+        "already_present": sorted(set(existing_columns) | set(existing_indexes)),
+        "to_add": [name for name, _ in missing_columns + missing_indexes],
+    }
+
+    # Status lines are collected and written in one go at the end
+    report = [
+        f"  Preflight: {len(preflight_report['already_present'])} already present, "
+        f"{len(preflight_report['to_add'])} to add",
+        *(f"    + {name}" for name in preflight_report["to_add"]),
     ]
 
-    with engine.connect() as conn:
-        for stmt in alter_statements:
-            try:
-                conn.execute(text(stmt))
-                print(f"  ✓ {stmt.split('ADD COLUMN IF NOT EXISTS ')[1].split()[0]}")
-            except Exception as e:
-                print(f"  ⚠ Warning: {e}")
-
-        for stmt in index_statements:
-            try:
-                conn.execute(text(stmt))
-                idx_name = stmt.split("INDEX IF NOT EXISTS ")[1].split()[0]
-                print(f"  ✓ Index: {idx_name}")
-            except Exception as e:
-                print(f"  ⚠ Warning: {e}")
-
-        conn.commit()
+    try:
+        if missing_columns:
+            alter_statement = "ALTER TABLE bugs " + ", ".join(
+                f"ADD COLUMN IF NOT EXISTS {name} {column_type}" for name, column_type in missing_columns
+            )
+
+            # All columns land together or not at all
+            with engine.begin() as conn:
+                conn.exec_driver_sql(alter_statement)
+            report.extend(f"  ✓ {name}" for name, _ in missing_columns)
+
+        if missing_indexes:
+            # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, including
+            # the implicit one around a multi-statement string, so each is sent alone
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                for idx_name, col in missing_indexes:
+                    try:
+                        conn.exec_driver_sql(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {idx_name} ON bugs({col})")
+                        report.append(f"  ✓ Index: {idx_name}")
+                    except Exception as e:
+                        report.append(f"  ⚠ Warning: {e}")
+    finally:
+        print("\n".join(report))
 
     print("\n✅ Triage columns migration complete!")
 
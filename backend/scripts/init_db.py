@@ -3,24 +3,110 @@ Initialize the database schema.
 Run this script to create all tables.
 """
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.core.database import engine, Base
+from sqlalchemy import inspect, text
+
+from app.core.database import Base, create_script_engine
 from app.models.bug import Bug  # Import models to register them
 
-def init_db():
-    """Create all database tables."""
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created successfully!")
-    
-    # Print created tables
-    print("\nCreated tables:")
+# Pause between index builds so each one's locks are released before the next starts
+INDEX_SPACING_SECONDS = 0.5
+
+
+def _create_tables(conn):
+    """
+    Create missing tables, deferring their secondary indexes to _create_indexes.
+
+    Unique indexes are created with their tables: they are the ON CONFLICT
+    arbiters for the bug and commit upserts, so the schema must never lack them.
+    """
+    indexes = {table: table.indexes for table in Base.metadata.sorted_tables}
+    try:
+        for table, table_indexes in indexes.items():
+            table.indexes = {index for index in table_indexes if index.unique}
+        Base.metadata.create_all(bind=conn, checkfirst=True)
+        # Needed by the trigram index even when bugs already exists, in which
+        # case its before_create listener doesn't fire
+        conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    finally:
+        for table, table_indexes in indexes.items():
+            table.indexes = table_indexes
+
+
+def _missing_tables(conn) -> list[str]:
+    """Postcheck: names of model tables the database still doesn't have."""
+    return [
+        table.name
+        for table in Base.metadata.sorted_tables
+        if conn.execute(text("SELECT to_regclass(:name)"), {"name": table.name}).scalar() is None
+    ]
+
+
+def _create_indexes(conn, report: dict[str, list[str]]):
+    """Create missing secondary indexes one at a time, committing after each."""
     for table in Base.metadata.sorted_tables:
-        print(f"  - {table.name}")
+        existing = {idx["name"] for idx in inspect(conn).get_indexes(table.name)}
+        secondary = [index for index in table.indexes if not index.unique]
+        for index in sorted(secondary, key=lambda idx: idx.name):
+            if index.name in existing:
+                report["skipped"].append(index.name)
+                continue
+            try:
+                index.create(bind=conn, checkfirst=True)
+                conn.commit()
+                report["created"].append(index.name)
+                print(f"  ✓ Index: {index.name}")
+            except Exception as e:
+                conn.rollback()
+                report["failed"].append(index.name)
+                print(f"  ⚠ Warning: {e}")
+            time.sleep(INDEX_SPACING_SECONDS)
+
+
+def init_db():
+    """Create all database tables and indexes, skipping any that already exist."""
+    # A dedicated unpooled connection, so the DDL never holds an app pool slot
+    engine = create_script_engine()
+    report = {"created": [], "skipped": [], "failed": []}
+
+    try:
+        with engine.connect() as conn:
+            print("Creating database tables...")
+            # Tables, extensions and views land in one transaction, so a failed
+            # run leaves nothing behind and can simply be re-run
+            with conn.begin():
+                existing = set(inspect(conn).get_table_names())
+                _create_tables(conn)
+
+            for table in Base.metadata.sorted_tables:
+                report["skipped" if table.name in existing else "created"].append(table.name)
+
+            missing = _missing_tables(conn)
+            conn.commit()
+            if missing:
+                report["failed"].extend(missing)
+                print(f"❌ Tables missing after creation: {', '.join(missing)}")
+            else:
+                print("✅ Database tables created successfully!")
+                print("\nCreating indexes...")
+                _create_indexes(conn, report)
+    finally:
+        engine.dispose()
+
+    print("\nSummary:")
+    for outcome, names in report.items():
+        print(f"  {outcome}: {len(names)}")
+        for name in names:
+            print(f"    - {name}")
+
+    if report["failed"]:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     init_db()
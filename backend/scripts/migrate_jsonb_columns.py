@@ -0,0 +1,61 @@
+"""
+Migration script to convert JSON and array columns to JSONB.
+Run this script after updating; new databases get JSONB columns from init_db.py.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import create_script_engine
+
+engine = create_script_engine()
+
+
+def migrate_jsonb_columns():
+    """Convert raw_data and the string array columns to JSONB and index them."""
+    print("Converting columns to JSONB...")
+
+    # Rewrites the tables, so run it during a quiet period; safe to re-run.
+    # The array GIN index is dropped first and rebuilt over the JSONB column.
+    alter_statements = [
+        "ALTER TABLE bugs ALTER COLUMN raw_data TYPE jsonb USING raw_data::jsonb",
+        "ALTER TABLE bugs ALTER COLUMN labels TYPE jsonb USING to_jsonb(labels)",
+        "ALTER TABLE bugs ALTER COLUMN triage_tags TYPE jsonb USING to_jsonb(triage_tags)",
+        "DROP INDEX IF EXISTS idx_commits_jira_keys_gin",
+        "ALTER TABLE commits ALTER COLUMN jira_keys TYPE jsonb USING to_jsonb(jira_keys)",
+    ]
+
+    # GIN indexes for @> containment lookups
+    index_statements = [
+        "CREATE INDEX IF NOT EXISTS idx_bugs_raw_data_gin ON bugs USING gin (raw_data jsonb_path_ops)",
+        "CREATE INDEX IF NOT EXISTS idx_commits_jira_keys_gin ON commits USING gin (jira_keys)",
+    ]
+
+    with engine.connect() as conn:
+        for stmt in alter_statements:
+            try:
+                conn.execute(text(stmt))
+                conn.commit()
+                print(f"  ✓ {stmt}")
+            except Exception as e:
+                print(f"  ⚠ Warning: {e}")
+                conn.rollback()
+
+        for stmt in index_statements:
+            try:
+                conn.execute(text(stmt))
+                idx_name = stmt.split("INDEX IF NOT EXISTS ")[1].split()[0]
+                print(f"  ✓ Index: {idx_name}")
+            except Exception as e:
+                print(f"  ⚠ Warning: {e}")
+
+        conn.commit()
+
+    print("\n✅ JSONB columns migration complete!")
+
+
+if __name__ == "__main__":
+    migrate_jsonb_columns()
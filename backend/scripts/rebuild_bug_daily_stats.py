@@ -0,0 +1,34 @@
+"""
+Migration script to rebuild the bug_daily_stats materialized view.
+Run this script after updating so daily created counts are bucketed by UTC day.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import Base, create_script_engine
+from app.models.bug import Bug  # Import models to register them
+
+engine = create_script_engine()
+
+
+def rebuild_bug_daily_stats():
+    """Drop bug_daily_stats and recreate it from the current model definition."""
+    print("Rebuilding bug_daily_stats materialized view...")
+
+    # Dropped and recreated in one transaction, so readers never see it missing.
+    # create_all re-runs the model's after_create DDL for the view and its index.
+    with engine.begin() as conn:
+        conn.execute(text("DROP MATERIALIZED VIEW IF EXISTS bug_daily_stats"))
+        print("  ✓ Dropped bug_daily_stats")
+        Base.metadata.create_all(bind=conn)
+        print("  ✓ Created bug_daily_stats")
+
+    print("\n✅ bug_daily_stats rebuild complete!")
+
+
+if __name__ == "__main__":
+    rebuild_bug_daily_stats()
@@ -0,0 +1,57 @@
+"""
+Tests for the COPY CSV encoding used by the bulk bug upsert.
+"""
+import csv
+import io
+from datetime import datetime, timezone
+
+import orjson
+
+from app.api.routes.bugs import _copy_csv_field
+
+
+def _parse_row(fields: list[str]) -> list[str]:
+    """Parse one encoded row back the way a CSV reader sees it."""
+    return next(csv.reader(io.StringIO(",".join(fields))))
+
+
+def test_none_is_an_unquoted_empty_field():
+    # COPY ... (FORMAT csv) reads an unquoted empty field as NULL
+    assert _copy_csv_field(None) == ""
+
+
+def test_empty_string_is_quoted():
+    # ...and a quoted empty field as an empty string, so the two stay distinct
+    assert _copy_csv_field("") == '""'
+
+
+def test_embedded_quotes_are_doubled():
+    assert _copy_csv_field('say "hi"') == '"say ""hi"""'
+
+
+def test_delimiters_and_newlines_round_trip():
+    value = 'a,b\n"c"\r\nd'
+    assert _parse_row([_copy_csv_field(value), _copy_csv_field("x")]) == [value, "x"]
+
+
+def test_list_is_encoded_as_json():
+    labels = ["migration", 'has "quotes"', "comma,label"]
+    (field,) = _parse_row([_copy_csv_field(labels)])
+    assert orjson.loads(field) == labels
+
+
+def test_dict_is_encoded_as_json():
+    raw = {"key": "MIG-1", "fields": {"summary": 'Broken "export"', "labels": []}}
+    (field,) = _parse_row([_copy_csv_field(raw)])
+    assert orjson.loads(field) == raw
+
+
+def test_datetime_is_encoded_as_isoformat():
+    value = datetime(2024, 1, 24, 10, 30, tzinfo=timezone.utc)
+    (field,) = _parse_row([_copy_csv_field(value)])
+    assert datetime.fromisoformat(field) == value
+
+
+def test_numbers_are_quoted_text():
+    assert _copy_csv_field(0.5) == '"0.5"'
+    assert _copy_csv_field(0) == '"0"'
@@ -0,0 +1,51 @@
+"""
+Tests for keyset pagination cursors.
+"""
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+@pytest.mark.parametrize("sort_value", [
+    datetime(2024, 1, 24, 10, 30, tzinfo=timezone.utc),
+    datetime(2024, 1, 24, 10, 30, 15, 123456, tzinfo=timezone(timedelta(hours=-5))),
+    datetime(2024, 1, 24, 10, 30),
+])
+def test_round_trip(sort_value):
+    decoded = decode_cursor(encode_cursor(sort_value, 42))
+    assert decoded == (sort_value, 42)
+    assert decoded[0].utcoffset() == sort_value.utcoffset()
+
+
+def test_round_trip_without_sort_value():
+    # Commits without authored_at sort last; their cursor carries only the id
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2024, 1, 24, 10, 30, tzinfo=timezone.utc), 10**12)
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not base64!",
+    "abc",  # bad padding
+    _b64(b"\xff\xfe,1"),  # not UTF-8
+    _b64(b"2024-01-24T10:30:00"),  # no id
+    _b64(b"2024-01-24T10:30:00,abc"),  # non-integer id
+    _b64(b"not-a-date,1"),
+    _b64(b"2024-13-45T10:30:00,1"),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
@@ -56,6 +56,7 @@ export const getOverviewStats = () =>
 export const getBugs = (params?: {
   page?: number;
   page_size?: number;
+  cursor?: string;
   status?: string;
   priority?: string;
   search?: string;
@@ -65,7 +66,12 @@ export const getBug = (jiraKey: string) =>
   api.get<Bug>(`/bugs/${jiraKey}`);
 
 export const syncBugs = (fetchAll = false, autoTriage = true) =>
-  api.post(`/bugs/sync?fetch_all=${fetchAll}&auto_triage=${autoTriage}`);
+  api.post<{ job_id: number; status: string; message: string }>(
+    `/bugs/sync?fetch_all=${fetchAll}&auto_triage=${autoTriage}`
+  );
+
+export const getSyncJob = (jobId: number) =>
+  api.get(`/bugs/sync/${jobId}`);
 
 // Triage endpoints
 export const triageBug = (jiraKey: string, force = false) =>
@@ -102,6 +108,7 @@ export interface GitHubStatus {
 export const getCommits = (params?: {
   page?: number;
   page_size?: number;
+  cursor?: string;
   jira_key?: string;
 }) => api.get<{
   commits: Commit[];
@@ -109,6 +116,7 @@ export const getCommits = (params?: {
   page: number;
   page_size: number;
   total_pages: number;
+  next_cursor: string | null;
 }>('/github/commits', { params });
 
 export const getBugCommits = (jiraKey: string) =>